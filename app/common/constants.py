@@ -1,103 +1,184 @@
 import os
 from enum import Enum
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable
 
 from dotenv import load_dotenv
 
-load_dotenv()
-
-
-DATABASE_URI = f"postgresql://{os.getenv("DB_USER")}:{os.getenv("DB_PASSWORD")}@{os.getenv("DB_HOST")}:{os.getenv("DB_PORT")}/{os.getenv("DB_NAME")}"
-ASYNC_SUPPORT_DB_URI = f"postgresql+asyncpg://{os.getenv("DB_USER")}:{os.getenv("DB_PASSWORD")}@{os.getenv("DB_HOST")}:{os.getenv("DB_PORT")}/{os.getenv("DB_NAME")}"
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS")
-ALLOWED_IMAGE_ORIGIN = os.getenv("ALLOWED_IMAGE_ORIGIN")
-REDIS_URL = os.getenv("REDIS_URL")
-BASE_URL = os.getenv("BASE_URL", "http://localhost:8082")
-REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
+ENV_FILE = Path(__file__).resolve().parent.parent.parent / ".env"
+
+
+def load_env_file() -> None:
+    """
+    Load the project's .env into os.environ, at most once per process.
+
+    Containers get their variables injected directly, so this is a no-op
+    when DOTENV_DISABLE=1 or when there is no .env file to read.
+    """
+    if os.environ.get("_DOTENV_LOADED") == "1":
+        return
+    os.environ["_DOTENV_LOADED"] = "1"
+
+    if os.environ.get("DOTENV_DISABLE") == "1":
+        return
+    if ENV_FILE.is_file():
+        load_dotenv(ENV_FILE, override=False)
+
+
+load_env_file()
+
+# One snapshot of the environment; plain dict lookups are cheaper than going
+# through os.environ's key/value encoding on every read.
+_E = dict(os.environ)
+
+_DB_USER = _E.get("DB_USER")
+_DB_PASSWORD = _E.get("DB_PASSWORD")
+_DB_HOST = _E.get("DB_HOST")
+_DB_PORT = _E.get("DB_PORT")
+_DB_NAME = _E.get("DB_NAME")
+
+DATABASE_URI = (
+    f"postgresql://{_DB_USER}:{_DB_PASSWORD}@{_DB_HOST}:{_DB_PORT}/{_DB_NAME}"
+)
+ASYNC_SUPPORT_DB_URI = (
+    f"postgresql+asyncpg://{_DB_USER}:{_DB_PASSWORD}@{_DB_HOST}:{_DB_PORT}/{_DB_NAME}"
+)
+DB_POOL_SIZE = int(_E.get("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(_E.get("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(_E.get("DB_POOL_RECYCLE", "1800"))
+SECRET_KEY = _E.get("SECRET_KEY")
+ALLOWED_ORIGINS = _E.get("ALLOWED_ORIGINS")
+ALLOWED_IMAGE_ORIGIN = _E.get("ALLOWED_IMAGE_ORIGIN")
+REDIS_URL = _E.get("REDIS_URL")
+BASE_URL = _E.get("BASE_URL", "http://localhost:8082")
+REDIS_PASSWORD = _E.get("REDIS_PASSWORD", "")
 
 # JWT
-JWT_SECRET = os.getenv("JWT_SECRET")
-ACCESS_TOKEN_MINUTES = int(os.getenv("ACCESS_TOKEN_MINUTES", "45"))
-REFRESH_TOKEN_DAYS = int(os.getenv("REFRESH_TOKEN_DAYS", "7"))
+JWT_SECRET = _E.get("JWT_SECRET")
+ACCESS_TOKEN_MINUTES = int(_E.get("ACCESS_TOKEN_MINUTES", "45"))
+REFRESH_TOKEN_DAYS = int(_E.get("REFRESH_TOKEN_DAYS", "7"))
 JWT_ALG = "HS256"
 
 
 # Google
-GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
-GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
-GOOGLE_REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI")
+GOOGLE_CLIENT_ID = _E.get("GOOGLE_CLIENT_ID")
+GOOGLE_CLIENT_SECRET = _E.get("GOOGLE_CLIENT_SECRET")
+GOOGLE_REDIRECT_URI = _E.get("GOOGLE_REDIRECT_URI")
 
 
 # github
-GITHUB_CLIENT_ID = os.getenv("GITHUB_CLIENT_ID")
-GITHUB_CLIENT_SECRET = os.getenv("GITHUB_CLIENT_SECRET")
-GITHUB_REDIRECT_URI = os.getenv("GITHUB_REDIRECT_URI")
+GITHUB_CLIENT_ID = _E.get("GITHUB_CLIENT_ID")
+GITHUB_CLIENT_SECRET = _E.get("GITHUB_CLIENT_SECRET")
+GITHUB_REDIRECT_URI = _E.get("GITHUB_REDIRECT_URI")
 
 
 # drop box
-DROPBOX_CLIENT_ID = os.getenv("DROPBOX_CLIENT_ID")
-DROPBOX_CLIENT_SECRET = os.getenv("DROPBOX_CLIENT_SECRET")
-DROPBOX_REDIRECT_URI = os.getenv("DROPBOX_REDIRECT_URI")
+DROPBOX_CLIENT_ID = _E.get("DROPBOX_CLIENT_ID")
+DROPBOX_CLIENT_SECRET = _E.get("DROPBOX_CLIENT_SECRET")
+DROPBOX_REDIRECT_URI = _E.get("DROPBOX_REDIRECT_URI")
 
 PER_PAGE = 20
-IS_DEV = bool(os.getenv("DEV", "").lower() == "true")
-FRONTEND_URL = os.getenv("FRONTEND_URL", "")
+IS_DEV = bool(_E.get("DEV", "").lower() == "true")
+FRONTEND_URL = _E.get("FRONTEND_URL", "")
 
 
 # Configuration
 UPLOAD_DIR = "uploads"
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
-ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+ALLOWED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+
+
+def is_allowed_upload(name: str) -> bool:
+    """Return True if ``name`` ends in one of ``ALLOWED_EXTENSIONS``."""
+    dot = name.rfind(".")
+    return dot >= 0 and name[dot:].lower() in ALLOWED_EXTENSIONS
+
+
 GOOGLE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
 DROPBOX_SEARCH_URL = "https://api.dropboxapi.com/2/files/search_v2"
 DROPBOX_API = "https://api.dropboxapi.com/2/files"
 
 
-MIME_TYPE_GROUPS = {
-    "document": [
-        "application/pdf",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # DOCX
-        "application/msword",  # DOC
-    ],
-    "video": [
-        "video/mp4",
-        "video/x-msvideo",  # AVI
-        "video/quicktime",  # MOV
-        "video/x-ms-wmv",  # WMV
-        "video/mpeg",  # MPEG
-        "video/x-matroska",  # MKV
-        "video/x-flv",  # FLV
-    ],
-    "image": [
-        "image/jpeg",
-        "image/png",
-        "image/webp",
-        "image/svg+xml",
-    ],
+@cache
+def _mime_type_groups():
+    return MappingProxyType(
+        {
+            "document": [
+                "application/pdf",
+                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # DOCX
+                "application/msword",  # DOC
+            ],
+            "video": [
+                "video/mp4",
+                "video/x-msvideo",  # AVI
+                "video/quicktime",  # MOV
+                "video/x-ms-wmv",  # WMV
+                "video/mpeg",  # MPEG
+                "video/x-matroska",  # MKV
+                "video/x-flv",  # FLV
+            ],
+            "image": [
+                "image/jpeg",
+                "image/png",
+                "image/webp",
+                "image/svg+xml",
+            ],
+        }
+    )
+
+
+@cache
+def _dropbox_ext_groups():
+    return MappingProxyType(
+        {
+            "document": frozenset(
+                {
+                    ".pdf",
+                    ".docx",
+                    ".doc",
+                }
+            ),
+            "video": frozenset(
+                {
+                    ".mp4",
+                    ".avi",
+                    ".mov",
+                    ".wmv",
+                    ".mpeg",
+                    ".mpg",
+                    ".mkv",
+                    ".flv",
+                }
+            ),
+            "image": frozenset(
+                {
+                    ".jpg",
+                    ".jpeg",
+                    ".png",
+                    ".webp",
+                    ".svg",
+                }
+            ),
+        }
+    )
+
+
+# Tables that are only needed by the storage-provider endpoints are built on
+# first access (PEP 562) and then cached as regular module attributes.
+_RESOLVERS: dict[str, Callable[[], Any]] = {
+    "MIME_TYPE_GROUPS": _mime_type_groups,
+    "DROPBOX_EXT_GROUPS": _dropbox_ext_groups,
 }
 
 
-DROPBOX_EXT_GROUPS = {
-    "document": [
-        ".pdf",
-        ".docx",
-        ".doc",
-    ],
-    "video": [
-        ".mp4",
-        ".avi",
-        ".mov",
-        ".wmv",
-        ".mpeg",
-        ".mpg",
-        ".mkv",
-        ".flv",
-    ],
-    "image": [
-        ".jpg",
-        ".jpeg",
-        ".png",
-        ".webp",
-        ".svg",
-    ],
-}
+def __getattr__(name: str) -> Any:
+    try:
+        resolver = _RESOLVERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = resolver()
+    globals()[name] = value
+    return value
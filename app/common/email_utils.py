@@ -1,13 +1,15 @@
 import datetime
 import os
+import time
 from pathlib import Path
 
-from dotenv import load_dotenv
 from fastapi import BackgroundTasks
 from fastapi_mail import ConnectionConfig, FastMail, MessageSchema, MessageType
 from pydantic import BaseModel, EmailStr, SecretStr
 
-load_dotenv()
+from app.common.constants import load_env_file
+
+load_env_file()
 
 # cnf = lambda: Path(__file__).parent.parent / "templates"
 
@@ -24,6 +26,19 @@ conf = ConnectionConfig(
     TEMPLATE_FOLDER=Path(__file__).parent.parent / "templates",
 )
 
+mailer = FastMail(conf)
+
+# [year, checked_at]; the year is re-read at most once an hour.
+_year_cache = [0, 0.0]
+
+
+def _current_year() -> int:
+    now = time.monotonic()
+    if not _year_cache[0] or now - _year_cache[1] > 3600:
+        _year_cache[0] = datetime.datetime.now().year
+        _year_cache[1] = now
+    return _year_cache[0]
+
 
 async def send_email(
     background_tasks: BackgroundTasks,
@@ -42,10 +57,9 @@ async def send_email(
         template_body={
             **context,
             "subject": subject,
-            "current_year": datetime.datetime.now().year,
+            "current_year": _current_year(),
         },
         subtype=MessageType.html,
     )
 
-    fm = FastMail(conf)
-    background_tasks.add_task(fm.send_message, message, template_name=template_name)
+    background_tasks.add_task(mailer.send_message, message, template_name=template_name)
@@ -1,43 +1,72 @@
-from enum import Enum
-
-
-class Providers(str, Enum):
+import sys
+from enum import Enum, EnumMeta
+
+
+class _FastEnumMeta(EnumMeta):
+    def __new__(metacls, cls, bases, classdict, **kwargs):
+        enum_cls = super().__new__(metacls, cls, bases, classdict, **kwargs)
+        # Intern string values so member-map probes with interned input
+        # strings match on identity before falling back to comparison.
+        for member in enum_cls.__members__.values():
+            if type(member._value_) is str:
+                member._value_ = sys.intern(member._value_)
+        enum_cls._value2member_map_ = {
+            member._value_: member for member in enum_cls.__members__.values()
+        }
+        return enum_cls
+
+    def __call__(cls, value, *args, **kwargs):
+        # Value lookups (``ModuleType("video")``) go straight to the member
+        # map; anything else (functional API, misses) takes the stdlib path.
+        if not args and not kwargs:
+            try:
+                return cls._value2member_map_[value]
+            except (KeyError, TypeError):
+                pass
+        return super().__call__(value, *args, **kwargs)
+
+
+class FastStrEnum(str, Enum, metaclass=_FastEnumMeta):
+    """``str`` enum with an O(1) value lookup on ``Cls(value)``."""
+
+
+class Providers(FastStrEnum):
     GOOGLE = "google"
     GITHUB = "github"
     DROP_BOX = "dropbox"
 
 
 # Enum classes for type safety
-class DifficultyLevel(str, Enum):
+class DifficultyLevel(FastStrEnum):
     BEGINNER = "beginner"
     INTERMEDIATE = "intermediate"
     ADVANCED = "advanced"
     EXPERT = "expert"
 
 
-class CourseStatus(str, Enum):
+class CourseStatus(FastStrEnum):
     DRAFT = "draft"
     PUBLISHED = "published"
     ARCHIVED = "archived"
 
 
-class EnrollmentType(str, Enum):
+class EnrollmentType(FastStrEnum):
     OPEN = "open"
     RESTRICTED = "restricted"
     INVITATION_ONLY = "invitation_only"
 
 
-class VisibilityType(str, Enum):
+class VisibilityType(FastStrEnum):
     PUBLIC = "public"
     PRIVATE = "private"
 
 
-class ProgressionType(str, Enum):
+class ProgressionType(FastStrEnum):
     SEQUENTIAL = "sequential"
     FLEXIBLE = "flexible"
 
 
-class ModuleType(str, Enum):
+class ModuleType(FastStrEnum):
     VIDEO = "video"
     DOCUMENT = "document"
     QUIZ = "quiz"
@@ -45,26 +74,26 @@ class ModuleType(str, Enum):
     EXTERNAL_LINK = "external_link"
 
 
-class AttachmentType(str, Enum):
+class AttachmentType(FastStrEnum):
     DOCUMENT = "document"
     EXTERNAL_LINK = "external_link"
 
 
-class VideoPlatform(str, Enum):
+class VideoPlatform(FastStrEnum):
     YOUTUBE = "youtube"
     DAILYMOTION = "dailymotion"
     DROP_BOX = "dropbox"
     GOOGLE_DRIVE = "googledrive"
 
 
-class DocumentPlatform(str, Enum):
+class DocumentPlatform(FastStrEnum):
     GOOGLE_DRIVE = "google_drive"
     DROPBOX = "dropbox"
     ONEDRIVE = "onedrive"
     DIRECT_LINK = "direct_link"
 
 
-class QuestionType(str, Enum):
+class QuestionType(FastStrEnum):
     MULTIPLE_CHOICE = "multiple_choice"
     TRUE_FALSE = "true_false"
     SHORT_ANSWER = "short_answer"
@@ -72,43 +101,43 @@ class QuestionType(str, Enum):
     MATCHING = "matching"
 
 
-class ShowResults(str, Enum):
+class ShowResults(FastStrEnum):
     IMMEDIATE = "immediate"
     AFTER_SUBMISSION = "after_submission"
     AFTER_DUE_DATE = "after_due_date"
 
 
-class EnrollmentStatus(str, Enum):
+class EnrollmentStatus(FastStrEnum):
     ACTIVE = "active"
     COMPLETED = "completed"
     DROPPED = "dropped"
     SUSPENDED = "suspended"
 
 
-class ModuleProgressStatus(str, Enum):
+class ModuleProgressStatus(FastStrEnum):
     NOT_STARTED = "not_started"
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     SKIPPED = "skipped"
 
 
-class QuizAttemptStatus(str, Enum):
+class QuizAttemptStatus(FastStrEnum):
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     ABANDONED = "abandoned"
 
 
-class ChatType(str, Enum):
+class ChatType(FastStrEnum):
     DIRECT = "direct"
     GROUP = "group"
 
 
-class GroupChatPrivacy(str, Enum):
+class GroupChatPrivacy(FastStrEnum):
     PRIVATE = "private"
     PUBLIC = "public"
 
 
-class MessageType(str, Enum):
+class MessageType(FastStrEnum):
     TEXT = "text"
     IMAGE = "image"
     FILE = "file"
@@ -116,26 +145,26 @@ class MessageType(str, Enum):
     SYSTEM = "system"  # For system messages like "User joined the chat"
 
 
-class MemberRole(str, Enum):
+class MemberRole(FastStrEnum):
     ADMIN = "admin"
     MODERATOR = "moderator"
     MEMBER = "member"
 
 
-class MemberStatus(str, Enum):
+class MemberStatus(FastStrEnum):
     ACTIVE = "active"
     LEFT = "left"
     KICKED = "kicked"
     BANNED = "banned"
 
 
-class SortCoursesBy(str, Enum):
+class SortCoursesBy(FastStrEnum):
     MOST_ENROLLED = "most_enrolled"
     TOP_RATED = "top_rated"
     RECENT = "recent"
 
 
-class MediaType(str, Enum):
+class MediaType(FastStrEnum):
     IMAGE = "image"
     PDF = "pdf"
     DOCUMENT = "document"  # Word, PowerPoint, etc.
@@ -143,11 +172,11 @@ class MediaType(str, Enum):
     OTHER = "other"
 
 
-class AnnotationType(str, Enum):
+class AnnotationType(FastStrEnum):
     NOTE = "note"
     HIGHLIGHT = "highlight"
 
 
-class UserRole(str, Enum):
+class UserRole(FastStrEnum):
     USER = "user"
     ADMIN = "admin"
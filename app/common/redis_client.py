@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 import redis.asyncio as aioredis
@@ -5,12 +6,22 @@ import redis.asyncio as aioredis
 from app.common.constants import IS_DEV, REDIS_PASSWORD, REDIS_URL
 
 
-def get_redis(**kwargs: Any) -> aioredis.Redis:
-    kwargs.setdefault("decode_responses", False)
-
+@lru_cache(maxsize=None)
+def _redis_client(**kwargs: Any) -> aioredis.Redis:
     return aioredis.from_url(
         REDIS_URL,
         encoding="utf-8",
         password=None if IS_DEV else REDIS_PASSWORD,
         **kwargs,
     )
+
+
+def get_redis(**kwargs: Any) -> aioredis.Redis:
+    """
+    Return the process-wide client for the given options.
+
+    Clients (and their connection pools) are created lazily and shared, so
+    every caller asking for the same options reuses one pool.
+    """
+    kwargs.setdefault("decode_responses", False)
+    return _redis_client(**kwargs)
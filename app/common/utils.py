@@ -1,42 +1,78 @@
 import base64
 import hashlib
-import json
 import random
 import re
 import string
 import unicodedata
 import uuid
-from typing import Any, Awaitable, Callable, List, Optional, Sequence, TypeVar, Union
+from typing import Any, Awaitable, Callable, Optional, Sequence, TypeVar, Union
 from urllib.parse import urljoin, urlparse
 
+import orjson
 from fastapi import HTTPException, WebSocketException
 from sqlalchemy import Select, func
-from sqlmodel import SQLModel, select
+from sqlmodel import SQLModel, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.common.constants import PER_PAGE, SECRET_KEY
 from app.models.user_model import Account
 
+_USERNAME_ALPHABET = tuple(string.ascii_lowercase + string.digits)
+_RNG = random.Random()
+_SECURE_RNG = random.SystemRandom()
+_USERNAME_BATCH_SIZE = 8
+
+_SLUG_SEPARATORS = re.compile(r"[\s_]+")
+_SLUG_DUPLICATE_HYPHENS = re.compile(r"-{2,}")
+# slugify works on ASCII only; drop everything that is not [a-z0-9-].
+_SLUG_INVALID_CHARS = str.maketrans(
+    "",
+    "",
+    "".join(
+        chr(c)
+        for c in range(128)
+        if not (chr(c).isdigit() or "a" <= chr(c) <= "z" or chr(c) == "-")
+    ),
+)
+
 
 async def generate_random_username(
-    session: AsyncSession, name: str, addons: int = 8
+    session: AsyncSession, name: str, addons: int = 8, secure: bool = False
 ) -> str:
+    """
+    Return an unused ``name@xxxxxxxx`` username.
+
+    A batch of candidates is checked with one query; only if every one of
+    them is taken do we try again, with a longer suffix. Pass ``secure=True``
+    to draw the suffix from the OS entropy source (slower).
+    """
+    choices = (_SECURE_RNG if secure else _RNG).choices
     while True:
-        username = f"{name}@" + "".join(
-            random.choices(string.ascii_lowercase + string.digits, k=addons)
+        candidates = [
+            f"{name}@" + "".join(choices(_USERNAME_ALPHABET, k=addons))
+            for _ in range(_USERNAME_BATCH_SIZE)
+        ]
+        taken = set(
+            (
+                await session.exec(
+                    select(Account.username).where(
+                        col(Account.username).in_(candidates)
+                    )
+                )
+            ).all()
         )
-        username_exists = (
-            await session.exec(select(Account).where(Account.username == username))
-        ).first()
 
-        if not username_exists:
-            return username
+        for username in candidates:
+            if username not in taken:
+                return username
+
+        addons += 1
 
 
 def safe_json_loads(data, default=None):
     try:
-        return json.loads(data)
-    except (json.JSONDecodeError, TypeError):
+        return orjson.loads(data)
+    except (orjson.JSONDecodeError, TypeError):
         return default
 
 
@@ -71,30 +107,30 @@ async def paginate(
     # Calculate offset
     offset = (page - 1) * per_page
 
-    # Get paginated items
-    paginated_query = query.offset(offset).limit(per_page)
-    items: List[T] = (await session.exec(paginated_query)).all()  # type: ignore
-
-    # Get total count
-    try:
-        # Create count query from the original query
-        if hasattr(query, "subquery"):
-            # For complex queries, use subquery approach
-            count_query = select(func.count()).select_from(query.subquery())
+    if getattr(query, "_distinct", False):
+        # The window count would run before DISTINCT and over-count.
+        items = (await session.exec(query.offset(offset).limit(per_page))).all()
+        total = await _count_rows(session, query) if items or offset else 0
+    else:
+        # Fetch the page and the total in one round-trip with COUNT(*) OVER ().
+        # session.execute always returns rows, so the total column survives
+        # even for single-entity selects that session.exec would scalarize.
+        entity_count = len(query.column_descriptions)
+        counted = query.add_columns(func.count().over().label("__total__"))
+        rows = (await session.execute(counted.offset(offset).limit(per_page))).all()
+
+        if rows:
+            total = rows[0][-1]
+        elif offset:
+            # Past the last page: the window has no rows to report on.
+            total = await _count_rows(session, query)
         else:
-            # For simple queries, count the table directly
-            count_query = select(func.count()).select_from(query.froms[0])
+            total = 0
 
-        total = (await session.exec(count_query)).one()
-    except Exception as e:
-        # Fallback: try a simpler count approach
-        try:
-            # Remove offset/limit and count
-            base_query = query.offset(None).limit(None)
-            total = len((await session.exec(base_query)).all())  # type: ignore
-        except Exception:
-            # Final fallback: use length of current items
-            total = len(items)
+        if entity_count == 1:
+            items = [row[0] for row in rows]
+        else:
+            items = [row[:-1] for row in rows]
 
     # Calculate total pages
     total_pages = (total + per_page - 1) // per_page if per_page > 0 else 0
@@ -105,11 +141,16 @@ async def paginate(
         "page": page,
         "per_page": per_page,
         "total_pages": total_pages,
-        "has_next": page < total_pages,
+        "has_next": offset + per_page < total,
         "has_prev": page > 1,
     }
 
 
+async def _count_rows(session: AsyncSession, query: Select) -> int:
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return (await session.exec(count_query)).one()
+
+
 def slugify(data: str, max_length: Optional[int] = None) -> str:
     """
     Create a URL-safe slug.
@@ -130,9 +171,9 @@ def slugify(data: str, max_length: Optional[int] = None) -> str:
     s = s.encode("ascii", "ignore").decode("ascii")
 
     s = s.lower().strip()
-    s = re.sub(r"[\s_]+", "-", s)  # spaces/underscores -> hyphen
-    s = re.sub(r"[^a-z0-9\-]", "", s)  # remove invalid chars
-    s = re.sub(r"-{2,}", "-", s)  # collapse multiple hyphens
+    s = _SLUG_SEPARATORS.sub("-", s)  # spaces/underscores -> hyphen
+    s = s.translate(_SLUG_INVALID_CHARS)  # remove invalid chars
+    s = _SLUG_DUPLICATE_HYPHENS.sub("-", s)  # collapse multiple hyphens
     s = s.strip("-")
 
     if max_length and max_length > 0:
@@ -142,17 +183,15 @@ def slugify(data: str, max_length: Optional[int] = None) -> str:
 
 
 def encode_state(data: dict[str, Any]) -> str:
-    """Encode state data as a base64 JSON string"""
-    json_str = json.dumps(data)
-    encoded = base64.urlsafe_b64encode(json_str.encode()).decode()
-    return encoded
+    """Encode state data as an unpadded base64 JSON string"""
+    return base64.urlsafe_b64encode(orjson.dumps(data)).decode().rstrip("=")
 
 
 def decode_state(state: str) -> dict[str, Any]:
-    """Decode state data from base64 JSON string"""
+    """Decode state data from base64 JSON string (padded or not)"""
     try:
-        json_str = base64.urlsafe_b64decode(state.encode()).decode()
-        return json.loads(json_str)
+        padding = "=" * (-len(state) % 4)
+        return orjson.loads(base64.urlsafe_b64decode(state + padding)) or {}
     except Exception:
         return {}
 
@@ -195,7 +234,8 @@ async def websocket_error_wrapper(
 
 
 def generate_base_64_encoded_uuid() -> str:
-    return base64.urlsafe_b64encode(str(uuid.uuid4()).encode()).decode("utf-8")
+    # Raw 16 bytes rather than the 36-char hex form: 22 chars, same entropy.
+    return base64.urlsafe_b64encode(uuid.uuid4().bytes).rstrip(b"=").decode("ascii")
 
 
 class CursorPaginationSerializer:
@@ -6,6 +6,7 @@ from collections import defaultdict
 from typing import Any, Awaitable, DefaultDict, Dict, Optional, Set
 from uuid import uuid4
 
+import orjson
 import redis.asyncio as aioredis
 from fastapi import WebSocket
 from redis import Redis
@@ -14,28 +15,43 @@ from .redis_client import get_redis
 
 
 class ConnectionManager:
+    """Track local websocket connections per document.
+
+    No lock is needed: connect/disconnect never await between reading and
+    mutating the registry, so they cannot interleave on the event loop.
+    A socket removed twice is simply a no-op.
+    """
+
     def __init__(self):
         self.active_connections: DefaultDict[str, Set[WebSocket]] = defaultdict(set)
-        self._lock = asyncio.Lock()
 
     async def connect(self, doc_id: str, ws: WebSocket):
         await ws.accept()
-        async with self._lock:
-            self.active_connections[doc_id].add(ws)
+        self.active_connections[doc_id].add(ws)
 
     async def disconnect(self, doc_id: str, ws: WebSocket):
-        async with self._lock:
-            self.active_connections[doc_id].discard(ws)
-            if not self.active_connections[doc_id]:
-                del self.active_connections[doc_id]
+        conns = self.active_connections.get(doc_id)
+        if conns is None:
+            return
+        conns.discard(ws)
+        if not conns:
+            self.active_connections.pop(doc_id, None)
 
     async def broadcast_local(self, doc_id: str, message: dict):
-        """Broadcast message to all local clients connected to this doc."""
-        conns = list(self.active_connections.get(doc_id, []))
-        for ws in conns:
-            try:
-                await ws.send_json(message)
-            except Exception:
+        """Broadcast message to all local clients connected to this doc.
+
+        The message is serialized once and sent to every socket concurrently;
+        sockets whose send failed are disconnected afterwards.
+        """
+        conns = list(self.active_connections.get(doc_id, ()))
+        if not conns:
+            return
+        payload = orjson.dumps(message).decode()
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in conns), return_exceptions=True
+        )
+        for ws, result in zip(conns, results):
+            if isinstance(result, Exception):
                 await self.disconnect(doc_id, ws)
 
 
@@ -108,7 +124,7 @@ class RedisPubSubManager:
         self._redis = get_redis(decode_responses=True, **self._redis_kwargs)
 
     async def close(self):
-        """Graceful shutdown: cancel listeners and close redis"""
+        """Graceful shutdown: cancel listeners and release redis"""
         self._shutdown.set()
 
         for ch, task in list(self._listener_tasks.items()):
@@ -116,12 +132,10 @@ class RedisPubSubManager:
             task.cancel()
         # wait a bit for tasks to finish
         await asyncio.sleep(0.1)
-        if self._redis:
-            try:
-                await self._redis.close()
-            except Exception:
-                pass
-            self._redis = None
+        # The client is the process-wide one from get_redis(); other users
+        # still need it, so only drop our reference. Each listener closes
+        # its own PubSub.
+        self._redis = None
         logger.info("RedisPubSubManager closed")
 
     def _channel_name(self, channel_id: str) -> ChannelName:
@@ -252,6 +266,7 @@ class RedisPubSubManager:
         backoff = 0.5
         max_backoff = 5.0
         while not self._shutdown.is_set():
+            pubsub = None
             try:
                 # create a new PubSub object for this listener
                 assert self._redis is not None
@@ -283,13 +298,6 @@ class RedisPubSubManager:
                     # Broadcast to local subscribers
                     await self._broadcast_to_local(channel, payload)
 
-                # if we break out of async for, close pubsub and loop to reconnect
-                try:
-                    await pubsub.unsubscribe(channel)
-                    await pubsub.close()
-                except Exception:
-                    pass
-
             except asyncio.CancelledError:
                 logger.info("Listener task for %s cancelled", channel)
                 break
@@ -302,25 +310,27 @@ class RedisPubSubManager:
                 )
                 await asyncio.sleep(backoff)
                 backoff = min(max_backoff, backoff * 2)
-                # try reconnecting (ensure redis connection is alive)
+                # try reconnecting (ensure redis connection is alive). The
+                # shared client is never closed here: its pool replaces
+                # broken connections on the next command.
                 try:
                     if not self._redis:
                         await self.connect()
-                    else:
-                        ping = self._redis.ping()
-                        if inspect.isawaitable(ping):
-                            await ping
+                    assert self._redis is not None
+                    ping = self._redis.ping()
+                    if inspect.isawaitable(ping):
+                        await ping
                 except Exception:
-                    # force reconnect by re-creating client
+                    logger.warning("Reconnect attempt failed")
+            finally:
+                # Always hand the PubSub connection back to the shared pool,
+                # whether the stream ended, crashed or was cancelled.
+                if pubsub is not None:
                     try:
-                        if self._redis:
-                            await self._redis.close()
-                    finally:
-                        self._redis = None
-                        try:
-                            await self.connect()
-                        except Exception:
-                            logger.warning("Reconnect attempt failed")
+                        await pubsub.unsubscribe(channel)
+                        await pubsub.close()
+                    except Exception:
+                        pass
             # loop to retry
         logger.info("Exiting listener loop for %s", channel)
 
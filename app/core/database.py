@@ -1,14 +1,12 @@
-import redis.asyncio as redis
-from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import create_engine
 
 from app.common.constants import (
     ASYNC_SUPPORT_DB_URI,
     DATABASE_URI,
-    IS_DEV,
-    REDIS_PASSWORD,
-    REDIS_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
 )
 
 # DB connection, session
@@ -19,12 +17,14 @@ def create_sync_engine():
 
 
 def create_async__db_engine():
-    return create_async_engine(ASYNC_SUPPORT_DB_URI, future=True, echo=False)
-
-
-redis_client: Redis = redis.from_url(
-    REDIS_URL,
-    encoding="utf-8",
-    password=None if IS_DEV else REDIS_PASSWORD,
-    decode_responses=True,
-)
+    # asyncpg behind AsyncAdaptedQueuePool (the async default): connections
+    # are reused across requests; pre_ping drops ones the server has closed.
+    return create_async_engine(
+        ASYNC_SUPPORT_DB_URI,
+        future=True,
+        echo=False,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
@@ -1,6 +1,7 @@
 # Shared dependencies for routes
 
 
+from functools import cache
 from typing import Annotated, AsyncGenerator, Optional
 
 from fastapi import (
@@ -19,29 +20,43 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from ..common import redis_client
 from ..models.user_model import Account
-from .database import create_async__db_engine, create_sync_engine, redis_client
+from .database import create_async__db_engine, create_sync_engine
 from .security import decode_token
 
-sync_engine = create_sync_engine()
-async_engine = create_async__db_engine()
 http_bearer = HTTPBearer(auto_error=False)
 
-async_session = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+
+@cache
+def get_engine():
+    """Sync engine, created on first use rather than at import."""
+    return create_sync_engine()
+
+
+@cache
+def get_async_engine():
+    """Async engine, created on first use rather than at import."""
+    return create_async__db_engine()
+
+
+@cache
+def get_async_session_maker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
 
 
 async def get_session():
-    async with async_session() as session:
+    async with get_async_session_maker()() as session:
         yield session
 
 
 async def get_redis() -> AsyncGenerator:
     try:
-        yield redis_client
+        yield redis_client.get_redis(decode_responses=True)
     finally:
         # you usually don’t close it per request
         pass
@@ -57,19 +72,25 @@ def get_token_from_request(
         Optional[HTTPAuthorizationCredentials], Depends(http_bearer)
     ] = None,
 ):
-
+    """Return the bearer token from the Authorization header, else the cookie."""
     if bearer_token and bearer_token.credentials:
         return bearer_token.credentials
 
-    cookie_token = request.cookies.get("access_token")
-    if cookie_token:
-        return cookie_token
+    return request.cookies.get("access_token") or ""
 
-    return ""
+
+async def get_token_payload(
+    credentials: Annotated[str, Depends(get_token_from_request)],
+) -> Optional[dict]:
+    """Decode the request's token once; FastAPI reuses the result per request."""
+    if not credentials:
+        return None
+
+    return decode_token(credentials)
 
 
 async def get_current_user(
-    credentials: Annotated[str, Depends(get_token_from_request)],
+    values: Annotated[Optional[dict], Depends(get_token_payload)],
     session: SessionDep,
 ):
     exception = HTTPException(
@@ -78,10 +99,9 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    if not credentials:
+    if not values:
         raise exception
 
-    values = decode_token(credentials)
     user_id = values.get("user_id")
     if not user_id:
         raise exception
@@ -101,14 +121,13 @@ async def get_current_user(
 
 
 async def get_current_user_silent(
-    credentials: Annotated[Optional[str], Depends(get_token_from_request)],
+    values: Annotated[Optional[dict], Depends(get_token_payload)],
     session: SessionDep,
 ):
 
-    if not credentials:
+    if not values:
         return
 
-    values = decode_token(credentials)
     user_id = values.get("user_id")
     if not user_id:
         return
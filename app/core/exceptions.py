@@ -1,4 +1,5 @@
 # Custom exception handlers
+import functools
 import json
 import logging
 import logging.config
@@ -10,26 +11,56 @@ from app.common.constants import IS_DEV
 
 
 def expand_env(obj):
-    if isinstance(obj, dict):
-        return {k: expand_env(v) for k, v in obj.items()}
-
-    elif isinstance(obj, list):
-        return [expand_env(i) for i in obj]
-
-    elif isinstance(obj, str) and obj.startswith("${") and obj.endswith("}"):
-        expr = obj[2:-1]
-
-        # Support default values: ${VAR:DEFAULT}
-        if ":" in expr:
-            name, default = expr.split(":", 1)
-            return os.getenv(name, default)
-
-        # No default → safe fallback is empty string (so app doesn't crash)
-        return os.getenv(expr, "")
-
-    return obj
-
-
+    """
+    Return a copy of ``obj`` with ``${VAR}`` / ``${VAR:DEFAULT}`` strings
+    replaced by environment values.
+
+    Walks the tree with an explicit stack and resolves each distinct
+    expression only once.
+    """
+    resolved: dict[str, str] = {}
+
+    def resolve(value: str) -> str:
+        if "${" not in value or not (value.startswith("${") and value.endswith("}")):
+            return value
+
+        expr = value[2:-1]
+        if expr not in resolved:
+            # Support default values: ${VAR:DEFAULT}
+            if ":" in expr:
+                name, default = expr.split(":", 1)
+                resolved[expr] = os.getenv(name, default)
+            else:
+                # No default → safe fallback is empty string (so app doesn't crash)
+                resolved[expr] = os.getenv(expr, "")
+        return resolved[expr]
+
+    def copy(value):
+        if isinstance(value, dict):
+            new = {}
+        elif isinstance(value, list):
+            new = [None] * len(value)
+        elif isinstance(value, str):
+            return resolve(value)
+        else:
+            return value
+
+        stack.append((value, new))
+        return new
+
+    stack: list = []
+    result = copy(obj)
+
+    while stack:
+        src, dst = stack.pop()
+        items = src.items() if isinstance(src, dict) else enumerate(src)
+        for key, value in items:
+            dst[key] = copy(value)
+
+    return result
+
+
+@functools.cache
 def setup_logger():
     if IS_DEV:
         # In dev mode, use simple console logger (not JSON formatted)
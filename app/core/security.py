@@ -1,7 +1,10 @@
+import hashlib
 import re
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
+import httpx
 import jwt
 from authlib.integrations.starlette_client import OAuth
 from fastapi import HTTPException
@@ -21,80 +24,168 @@ from app.common.constants import (
     REFRESH_TOKEN_DAYS,
 )
 
-oauth = OAuth()
 
-oauth.register(
-    name="google",
-    client_id=GOOGLE_CLIENT_ID,
-    client_secret=GOOGLE_CLIENT_SECRET,
-    server_metadata_url="https://accounts.google.com/.well-known/openid-configuration",
-    client_kwargs={"scope": "openid email profile"},
-)
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """
+    Connection pool shared by every Authlib client.
+
+    Authlib builds and closes a fresh httpx client for each OAuth call; this
+    wrapper ignores those closes so keep-alive connections to the providers
+    survive between requests. The pool itself is closed by
+    ``close_oauth_transport`` on shutdown.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
 
-oauth.register(
-    name="github",
-    client_id=GITHUB_CLIENT_ID,
-    client_secret=GITHUB_CLIENT_SECRET,
-    access_token_url="https://github.com/login/oauth/access_token",
-    authorize_url="https://github.com/login/oauth/authorize",
-    api_base_url="https://api.github.com/",
-    client_kwargs={"scope": "read:user user:email"},
+
+_oauth_pool = httpx.AsyncHTTPTransport(
+    limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
 )
+oauth_transport = _SharedTransport(_oauth_pool)
+
+
+async def close_oauth_transport():
+    await _oauth_pool.aclose()
+
 
-oauth.register(
-    name="dropbox",
-    client_id=DROPBOX_CLIENT_ID,
-    client_secret=DROPBOX_CLIENT_SECRET,
-    authorize_url="https://www.dropbox.com/oauth2/authorize",
-    access_token_url="https://api.dropboxapi.com/oauth2/token",
-    api_base_url="https://api.dropboxapi.com/2/",
-    client_kwargs={
-        "scope": "files.metadata.read files.content.write account_info.read files.metadata.write files.content.read sharing.write sharing.read"
-    },
+GOOGLE_SCOPE = "openid email profile"
+GITHUB_SCOPE = "read:user user:email"
+DROPBOX_SCOPE = " ".join(
+    (
+        "files.metadata.read",
+        "files.content.write",
+        "account_info.read",
+        "files.metadata.write",
+        "files.content.read",
+        "sharing.write",
+        "sharing.read",
+    )
 )
 
 
+def _setup_oauth() -> OAuth:
+    """Register every OAuth provider once; the result is the module's ``oauth``."""
+    registry = OAuth()
+
+    registry.register(
+        name="google",
+        client_id=GOOGLE_CLIENT_ID,
+        client_secret=GOOGLE_CLIENT_SECRET,
+        server_metadata_url="https://accounts.google.com/.well-known/openid-configuration",
+        client_kwargs={"scope": GOOGLE_SCOPE, "transport": oauth_transport},
+    )
+
+    registry.register(
+        name="github",
+        client_id=GITHUB_CLIENT_ID,
+        client_secret=GITHUB_CLIENT_SECRET,
+        access_token_url="https://github.com/login/oauth/access_token",
+        authorize_url="https://github.com/login/oauth/authorize",
+        api_base_url="https://api.github.com/",
+        client_kwargs={"scope": GITHUB_SCOPE, "transport": oauth_transport},
+    )
+
+    registry.register(
+        name="dropbox",
+        client_id=DROPBOX_CLIENT_ID,
+        client_secret=DROPBOX_CLIENT_SECRET,
+        authorize_url="https://www.dropbox.com/oauth2/authorize",
+        access_token_url="https://api.dropboxapi.com/oauth2/token",
+        api_base_url="https://api.dropboxapi.com/2/",
+        client_kwargs={"scope": DROPBOX_SCOPE, "transport": oauth_transport},
+    )
+
+    return registry
+
+
+oauth = _setup_oauth()
+
+
+if JWT_SECRET is None:
+    raise ValueError("JWT SECRET NOT SET")
+
+# Pass the HMAC key as bytes so PyJWT doesn't re-encode it on every call.
+_JWT_KEY = JWT_SECRET.encode("utf-8")
+_JWT_ALGORITHMS = [JWT_ALG]
+
+# Verified payloads keyed by sha256(token) -> (valid_until, payload). Entries
+# live at most _TOKEN_CACHE_TTL seconds and never past the token's own exp.
+_TOKEN_CACHE_TTL = 30
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: dict[bytes, tuple[float, dict]] = {}
+
+_ACCESS_TOKEN_TTL = timedelta(minutes=ACCESS_TOKEN_MINUTES)
+_REFRESH_TOKEN_TTL = timedelta(days=REFRESH_TOKEN_DAYS)
+
+
 def decode_token(token: str) -> dict:
-    if JWT_SECRET is None:
-        raise ValueError("JWT SECRET NOT SET")
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        if now < cached[0]:
+            return cached[1]
+        _token_cache.pop(key, None)
 
     try:
-        return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALG])
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
 
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    valid_until = now + _TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        valid_until = min(valid_until, exp)
+
+    if len(_token_cache) >= _TOKEN_CACHE_MAX:
+        # dicts keep insertion order, so this drops the oldest entry
+        _token_cache.pop(next(iter(_token_cache)))
+    _token_cache[key] = (valid_until, payload)
+    return payload
+
 
 def create_jwt_token(
     user_id: str, email: str, kind: str = "access", exp: int | None = None
 ):
-    if JWT_SECRET is None:
-        raise ValueError("JWT SECRET NOT SET")
-
     iat = datetime.now(tz=timezone.utc)
-    payload = {"user_id": user_id, "iat": iat}
 
     if kind == "access":
-        payload.update(
+        return jwt.encode(
             {
+                "user_id": user_id,
+                "iat": iat,
                 "type": "access",
                 "email": email,
-                "exp": iat
-                + timedelta(minutes=ACCESS_TOKEN_MINUTES if not exp else exp),
-            }
-        )
-    else:
-        payload.update(
-            {
-                "type": "refresh",
-                "exp": iat + timedelta(days=REFRESH_TOKEN_DAYS if not exp else exp),
-            }
+                "exp": iat + (timedelta(minutes=exp) if exp else _ACCESS_TOKEN_TTL),
+            },
+            _JWT_KEY,
+            algorithm=JWT_ALG,
         )
 
-    encoded_jwt = jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALG)
-    return encoded_jwt
+    return jwt.encode(
+        {
+            "user_id": user_id,
+            "iat": iat,
+            "type": "refresh",
+            "exp": iat + (timedelta(days=exp) if exp else _REFRESH_TOKEN_TTL),
+        },
+        _JWT_KEY,
+        algorithm=JWT_ALG,
+    )
+
+
+_STATE_ALG = "HS256"
+_STATE_AUDIENCE = "oauth_state"
 
 
 def sign_state(payload: dict[str, Any], expires_seconds: int = 300) -> str:
@@ -102,20 +193,20 @@ def sign_state(payload: dict[str, Any], expires_seconds: int = 300) -> str:
     data.setdefault(
         "exp", datetime.now(tz=timezone.utc) + timedelta(seconds=expires_seconds)
     )
-    data["purpose"] = "oauth_state"
-    if JWT_SECRET is None:
-        raise ValueError("JWT SECRET NOT SET")
+    data["aud"] = _STATE_AUDIENCE
 
-    return jwt.encode(data, JWT_SECRET, algorithm="HS256")
+    return jwt.encode(data, _JWT_KEY, algorithm=_STATE_ALG)
 
 
 def verify_state(token: str) -> Optional[dict[str, Any]]:
-    if JWT_SECRET is None:
-        raise ValueError("JWT SECRET NOT SET")
+    # The audience check rejects any JWT that was not minted by sign_state.
     try:
-        data = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
-        if data.get("purpose") != "oauth_state":
-            return None
-        return data
-    except Exception:
+        return jwt.decode(
+            token,
+            _JWT_KEY,
+            algorithms=[_STATE_ALG],
+            audience=_STATE_AUDIENCE,
+            options={"require": ["exp", "aud"]},
+        )
+    except jwt.InvalidTokenError:
         return None
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pydantic_settings import BaseSettings
 
 
@@ -8,5 +10,9 @@ class LangConfig(BaseSettings):
     class Config:
         env_prefix = "LOCALE_"
 
+    @cached_property
+    def supported_set(self) -> frozenset[str]:
+        return frozenset(self.supported_locale)
+
 
 settings = LangConfig()
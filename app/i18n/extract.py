@@ -1,45 +1,93 @@
-import json
+import mmap
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from genericpath import isfile
+import orjson
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 LOCALES_DIR = Path(__file__).resolve().parent / "locales"
 SOURCE_LANG = "en"
 SOURCE_FILE = LOCALES_DIR / SOURCE_LANG / "translations.json"
 
-TRANSLATION_KEY_REGEX = re.compile(r"trans\.t\([\"']([\w\.\-]+)[\"']\)")
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        "site-packages",
+        "dist",
+        "build",
+        ".mypy_cache",
+        ".pytest_cache",
+    }
+)
+
+PARALLEL_SCAN_MIN_FILES = 500
+
+TRANSLATION_CALL = b"trans.t("
+TRANSLATION_KEY_REGEX = re.compile(rb"trans\.t\([\"']([\w\.\-]+)[\"']\)")
+
+
+def iter_source_files(root: Path):
+    """Yield paths of .py files under root, skipping VCS/venv/build trees."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry.path
+
+
+def scan_file(path: str) -> list[str]:
+    """Return the translation keys used in one file, read through mmap."""
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return []
+
+        with data:
+            # Most files never call trans.t(); skip the regex for them.
+            if data.find(TRANSLATION_CALL) == -1:
+                return []
+            return [key.decode() for key in TRANSLATION_KEY_REGEX.findall(data)]
 
 
 def find_translation_keys():
     keys = set()
+    files = list(iter_source_files(BASE_DIR))
 
-    for root, _, files in os.walk(BASE_DIR):
-        for file in files:
-            if file.endswith(".py"):
-                path = Path(root) / file
-                text = path.read_text()
-
-                found = TRANSLATION_KEY_REGEX.findall(text)
+    # Process start-up only pays off once there are enough files to share out.
+    if len(files) < PARALLEL_SCAN_MIN_FILES:
+        for path in files:
+            keys.update(scan_file(path))
+    else:
+        with ProcessPoolExecutor() as executor:
+            for found in executor.map(scan_file, files, chunksize=64):
                 keys.update(found)
 
     return sorted(keys)
 
 
 def insert_key(container, key_parts):
-    part = key_parts[0]
-
-    if len(key_parts) == 1:
-        if part not in container:
-            container[part] = "__FILL_ME__"
-        return
-
-    if part not in container or not isinstance(container[part], dict):
-        container[part] = {}
+    node = container
+    for part in key_parts[:-1]:
+        child = node.get(part)
+        if not isinstance(child, dict):
+            child = {}
+            node[part] = child
+        node = child
 
-    insert_key(container[part], key_parts[1:])
+    last = key_parts[-1]
+    if last not in node:
+        node[last] = "__FILL_ME__"
 
 
 def main():
@@ -49,14 +97,14 @@ def main():
     print(f"→ Found {len(keys)} translation keys.")
 
     if SOURCE_FILE.exists():
-        src_dict = json.loads(SOURCE_FILE.read_text())
+        src_dict = orjson.loads(SOURCE_FILE.read_bytes())
     else:
         src_dict = {}
 
     for k in keys:
         insert_key(src_dict, k.split("."))
 
-    SOURCE_FILE.write_text(json.dumps(src_dict, indent=2, ensure_ascii=False))
+    SOURCE_FILE.write_bytes(orjson.dumps(src_dict, option=orjson.OPT_INDENT_2))
     print(f"✨ Updated source locale: {SOURCE_FILE}")
 
 
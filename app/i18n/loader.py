@@ -1,7 +1,7 @@
-import json
-from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 from app.i18n.translation import Language
 
 from .config import settings
@@ -9,17 +9,21 @@ from .config import settings
 base_path = Path(__file__).resolve().parent / "locales"
 
 
-@lru_cache(maxsize=None)
-def translation(lang: str = "") -> Language:
-    locale = settings.default_locale
-    if lang in settings.supported_locale:
-        locale = lang
-
+def _load_language(locale: str) -> Language:
     try:
-        file_path = base_path / locale / "translations.json"
-        with file_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads((base_path / locale / "translations.json").read_bytes())
     except FileNotFoundError:
         data = {}
 
-    return Language(lang, data)
+    return Language(locale, data)
+
+
+# Every supported locale is parsed once at import so no request pays for it.
+_LANGUAGES: dict[str, Language] = {
+    locale: _load_language(locale)
+    for locale in settings.supported_set | {settings.default_locale}
+}
+
+
+def translation(lang: str = "") -> Language:
+    return _LANGUAGES.get(lang) or _LANGUAGES[settings.default_locale]
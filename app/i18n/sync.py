@@ -1,6 +1,7 @@
-import json
 from pathlib import Path
 
+import orjson
+
 BASE_DIR = Path(__file__).resolve().parent
 LOCALES_DIR = BASE_DIR / "locales"
 SOURCE_LANG = "en"
@@ -10,12 +11,12 @@ SOURCE_FILE = LOCALES_DIR / SOURCE_LANG / "translations.json"
 def load_json(path: Path):
     if not path.exists():
         return {}
-    return json.loads(path.read_text())
+    return orjson.loads(path.read_bytes())
 
 
 def save_json(path: Path, content: dict):
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(content, ensure_ascii=False, indent=2))
+    path.write_bytes(orjson.dumps(content, option=orjson.OPT_INDENT_2))
 
 
 def sync_dict(source: dict, target: dict, lang: str, prefix=""):
@@ -23,28 +24,28 @@ def sync_dict(source: dict, target: dict, lang: str, prefix=""):
     missing = []
     extra = []
 
-    for key, src_val in source.items():
-        full_key = f"{prefix}{key}"
-        if isinstance(src_val, dict):
-            if key not in target or not isinstance(target[key], dict):
-                target[key] = {}
-                updated = True
-
-            u, m, e = sync_dict(src_val, target[key], lang, full_key + ".")
-            updated |= u
-            missing.extend(m)
-            extra.extend(e)
-        else:
-            if key not in target:
-                target[key] = ""
+    # Paths are kept as tuples and only joined into dotted keys when reported.
+    stack = [(source, target, ())]
+    while stack:
+        src, tgt, path = stack.pop()
+
+        for key, src_val in src.items():
+            if isinstance(src_val, dict):
+                tgt_val = tgt.get(key)
+                if not isinstance(tgt_val, dict):
+                    tgt_val = tgt[key] = {}
+                    updated = True
+
+                stack.append((src_val, tgt_val, path + (key,)))
+            elif key not in tgt:
+                tgt[key] = ""
                 updated = True
-                missing.append(full_key)
+                missing.append(prefix + ".".join(path + (key,)))
 
-    for k in list(target.keys()):
-        if k not in source:
-            del target[k]
+        for k in [k for k in tgt if k not in src]:
+            del tgt[k]
             updated = True
-            extra.append(prefix + k)
+            extra.append(prefix + ".".join(path + (k,)))
 
     return updated, missing, extra
 
@@ -1,26 +1,71 @@
-from typing import Any
+from string import Formatter
+from typing import Any, Optional
+
+_formatter = Formatter()
+
+# Pre-parsed template: (literal text, placeholder name or None) pairs.
+Template = list[tuple[str, Optional[str]]]
+
+
+def _flatten(data: Any) -> dict[str, str]:
+    """Map every dotted path in ``data`` that ends at a string to that string."""
+    flat: dict[str, str] = {}
+    if not isinstance(data, dict):
+        return flat
+
+    stack = [(data, "")]
+    while stack:
+        node, prefix = stack.pop()
+        for k, v in node.items():
+            if isinstance(v, dict):
+                stack.append((v, f"{prefix}{k}."))
+            elif isinstance(v, str):
+                flat[f"{prefix}{k}"] = v
+    return flat
+
+
+def _compile(value: str) -> Optional[Template]:
+    """Parse a ``{name}`` template, or return None if it is anything fancier."""
+    if "{{" in value or "}}" in value:
+        return None
+    try:
+        parsed = list(_formatter.parse(value))
+    except ValueError:
+        return None
+
+    parts: Template = []
+    for literal, name, spec, conversion in parsed:
+        if name is not None and (not name.isidentifier() or spec or conversion):
+            return None
+        parts.append((literal, name))
+    return parts
 
 
 class Language:
     def __init__(self, lang_code: str, data: Any):
         self.lang_code = lang_code
         self.data = data
+        self._flat = _flatten(data)
+        # Only values containing "{" need substitution; everything else is
+        # returned as-is. A None template falls back to plain replacement.
+        self._templates: dict[str, Optional[Template]] = {
+            k: _compile(v) for k, v in self._flat.items() if "{" in v
+        }
 
     def t(self, key: str, **kwargs):
-        lookups = key.split(".")
-        value = self.data
-
-        for param in lookups:
-            if not isinstance(value, dict) or param not in value:
-                value = key
-                break
-            value = value[param]
-
-        if not isinstance(value, str):
-            value = key
+        value = self._flat.get(key, key)
+        if not kwargs or key not in self._templates:
+            return value
 
-        for k, v in kwargs.items():
-            replace_text = f"{{{k}}}"
-            value = value.replace(replace_text, str(v))
+        parts = self._templates[key]
+        if parts is None:
+            for k, v in kwargs.items():
+                value = value.replace(f"{{{k}}}", str(v))
+            return value
 
-        return value
+        out = []
+        for literal, name in parts:
+            out.append(literal)
+            if name is not None:
+                out.append(str(kwargs[name]) if name in kwargs else f"{{{name}}}")
+        return "".join(out)
@@ -1,17 +1,24 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.common.constants import ALLOWED_ORIGINS, SECRET_KEY
 from app.common.utils import safe_json_loads
 from app.common.ws_manager import manager
+from app.core.dependencies import get_async_engine, get_async_session_maker
 from app.core.exceptions import setup_logger
+from app.core.security import close_oauth_transport
 from app.modules import chat, creator, management, media, notification, student
+from app.modules.chat.service import ChatService
+from app.modules.media.router import close_proxy_client
 
 from .modules import account, auth, chat, course, media
 
@@ -19,19 +26,42 @@ from .modules import account, auth, chat, course, media
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     app_logger = logging.getLogger("app")
+    last_read_flusher = None
     try:
         app_logger.info("Starting lifespan setup...")
+        session_maker = get_async_session_maker()
         await manager.connect()
+        last_read_flusher = asyncio.create_task(
+            ChatService.last_read_flush_loop(session_maker)
+        )
         app_logger.info("Lifespan setup completed.")
         yield
     except Exception as e:
         app_logger.exception(f"Lifespan error: {e}")
         raise
     finally:
+        if last_read_flusher:
+            last_read_flusher.cancel()
+            try:
+                # Write back whatever read pointers are still queued.
+                async with get_async_session_maker()() as session:
+                    await ChatService.flush_last_read(session)
+            except Exception:
+                app_logger.exception("Final chat read pointer flush failed")
         await manager.close()
+        await close_proxy_client()
+        await close_oauth_transport()
+        await get_async_engine().dispose()
 
 
-app = FastAPI(lifespan=lifespan)
+class AppJSONResponse(ORJSONResponse):
+    """orjson-rendered JSON that, like the stdlib encoder, accepts non-str keys."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=AppJSONResponse)
 app_logger = setup_logger()
 
 
@@ -43,7 +73,9 @@ assert ALLOWED_ORIGINS is not None
 assert SECRET_KEY is not None
 
 # middlewares
-origins = safe_json_loads(ALLOWED_ORIGINS, [])
+# CORSMiddleware checks ``origin in allow_origins`` on every request; a
+# frozenset makes that a hash lookup instead of a list scan.
+ORIGINS: frozenset[str] = frozenset(safe_json_loads(ALLOWED_ORIGINS, []))
 
 
 # @app.middleware("http")
@@ -59,7 +91,7 @@ origins = safe_json_loads(ALLOWED_ORIGINS, [])
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
+    allow_origins=ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
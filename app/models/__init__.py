@@ -8,6 +8,7 @@ from app.models.courses_model import (
     DocumentContent,
     Module,
     ModuleAttachment,
+    QuizAnswer,
     QuizAttempt,
     QuizContent,
     QuizQuestion,
@@ -1,5 +1,5 @@
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy import Column, DateTime, Index
@@ -7,7 +7,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship
 
 from app.common.enum import AnnotationType
-from app.models.base import AppBaseModelMixin, AppSQLModel
+from app.models.base import AppBaseModelMixin, AppSQLModel, utcnow
 
 if TYPE_CHECKING:
     from .courses_model import DocumentContent
@@ -59,7 +59,7 @@ class DocumentChatBase(AppSQLModel):
         description="Array of messages in the chat: [{'role': 'user', 'content': ...}, ...]",
     )
     last_message_at: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
+        default_factory=utcnow,
         sa_column=Column(
             DateTime(timezone=True),
             comment="Stored in UTC for ordering recent chats",
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
+from typing import Any
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, text
 from sqlmodel import Field, SQLModel
 
 
@@ -16,13 +17,40 @@ class AppSQLModel(SQLModel):
         }
 
 
+_UTC = timezone.utc
+
+
+def utcnow() -> datetime:
+    """Timezone-aware now; the default factory for every timestamp column."""
+    return datetime.now(_UTC)
+
+
+# Server-side default for UUID primary keys. ORM inserts still fill ids in
+# Python (default_factory) so they are known before flush; Core/bulk inserts
+# that omit the column let Postgres generate them instead.
+UUID_SERVER_DEFAULT = {"server_default": text("gen_random_uuid()")}
+
+
 class AppBaseModelMixin(AppSQLModel):
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
+        default_factory=utcnow,
         sa_type=DateTime(timezone=True),
     )
+    # model_post_init copies created_at here so ORM-built rows share one
+    # timestamp; the column default covers Core/bulk inserts that omit it.
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
+        default=None,
+        nullable=False,
         sa_type=DateTime(timezone=True),
-        sa_column_kwargs={"onupdate": lambda: datetime.now(tz=timezone.utc)},
+        sa_column_kwargs={"default": utcnow, "onupdate": utcnow},
     )
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.updated_at is not None:
+            return
+        if "_sa_instance_state" in self.__dict__:
+            self.updated_at = self.created_at
+        else:
+            # model_validate() runs this mid-validation, before SQLModel has
+            # restored the SQLAlchemy state; it copies __dict__ back after.
+            self.__dict__["updated_at"] = self.created_at
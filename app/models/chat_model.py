@@ -1,9 +1,9 @@
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import Column, DateTime, Index, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, DateTime, Index, UniqueConstraint, desc, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlmodel import Field, Relationship
 
 from app.common.enum import (
@@ -13,7 +13,7 @@ from app.common.enum import (
     MemberStatus,
     MessageType,
 )
-from app.models.base import AppBaseModelMixin, AppSQLModel
+from app.models.base import UUID_SERVER_DEFAULT, AppBaseModelMixin, AppSQLModel, utcnow
 
 if TYPE_CHECKING:
     from .courses_model import Course
@@ -30,53 +30,72 @@ class ChatBase(AppSQLModel):
     )  # Only for group chats
     is_active: bool = Field(default=True)
     last_message_at: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
+        default_factory=utcnow,
         sa_type=DateTime(timezone=True),
     )
 
 
 class Chat(AppBaseModelMixin, ChatBase, table=True):
 
-    __table_args__ = (Index("ix_privacy_active", "privacy", "is_active"),)
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    __table_args__ = (
+        Index("ix_privacy_active", "privacy", "is_active"),
+        Index("ix_chat_last_message", "last_message_at"),
+        Index("ix_chat_participants_gin", "participant_ids", postgresql_using="gin"),
+    )
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4,
+        primary_key=True,
+        sa_column_kwargs=UUID_SERVER_DEFAULT,
+    )
 
     account_id: Optional[uuid.UUID] = Field(
         foreign_key="account.id", ondelete="SET NULL", index=True, default=None
     )  # User who created the chat
     course_id: Optional[str] = Field(
-        foreign_key="course.id", default=None, ondelete="SET NULL"
+        foreign_key="course.id", default=None, index=True, ondelete="SET NULL"
     )  # Optional course association
     max_members: Optional[int] = Field(default=None, ge=2, le=50)
 
+    # Maintained by database triggers on chat_member / message inserts and
+    # deletes (see the chat_counters and chat_participants migrations); never
+    # written by the app.
+    member_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    message_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    # Account ids of the members, for containment (@>) lookups.
+    participant_ids: list[uuid.UUID] = Field(
+        default_factory=list,
+        sa_column=Column(
+            ARRAY(UUID(as_uuid=True)), server_default="{}", nullable=False
+        ),
+    )
+
     # Relationships
     course: Optional["Course"] = Relationship(back_populates="chats")
     account: Optional["Account"] = Relationship(
         back_populates="created_chats",
         sa_relationship_kwargs={"lazy": "selectin"},
     )
-    messages: list["Message"] = Relationship(back_populates="chat", cascade_delete=True)
+    # Unbounded collections: write-only, so touching them never loads every
+    # row. Page through ChatService (list_messages / list_members) instead;
+    # deletes cascade in the database (message.chat_id ON DELETE CASCADE).
+    messages: list["Message"] = Relationship(
+        back_populates="chat",
+        cascade_delete=True,
+        passive_deletes=True,
+        sa_relationship_kwargs={"lazy": "write_only"},
+    )
     members: list["ChatMember"] = Relationship(
-        back_populates="chat", passive_deletes="all"
+        back_populates="chat",
+        passive_deletes="all",
+        sa_relationship_kwargs={"lazy": "write_only"},
     )
 
-    # Indexes
-    class Config:
-        json_schema_extra = {
-            "indexes": [
-                {"fields": ["chat_type"]},
-                {"fields": ["privacy"]},
-                {"fields": ["course_id"]},
-                {"fields": ["account"]},
-                {"fields": ["is_active"]},
-            ]
-        }
-
 
 class ChatMemberBase(AppSQLModel):
     role: MemberRole = Field(default=MemberRole.MEMBER)
     status: MemberStatus = Field(default=MemberStatus.ACTIVE)
     joined_at: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
+        default_factory=utcnow,
         sa_type=DateTime(timezone=True),
     )
     left_at: Optional[datetime] = Field(
@@ -99,7 +118,11 @@ class ChatMember(AppBaseModelMixin, ChatMemberBase, table=True):
         Index("ix_chat_role", "chat_id", "role"),
     )
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4,
+        primary_key=True,
+        sa_column_kwargs=UUID_SERVER_DEFAULT,
+    )
     chat_id: uuid.UUID = Field(foreign_key="chat.id", index=True, ondelete="CASCADE")
     account_id: uuid.UUID = Field(
         foreign_key="account.id", ondelete="CASCADE", index=True
@@ -122,26 +145,22 @@ class ChatMember(AppBaseModelMixin, ChatMemberBase, table=True):
     messages: list["Message"] = Relationship(
         back_populates="sender",
         passive_deletes="all",
-        sa_relationship_kwargs={"foreign_keys": "[Message.sender_id]"},
+        sa_relationship_kwargs={
+            "foreign_keys": "[Message.sender_id]",
+            "lazy": "write_only",
+        },
     )
     chat_invites: list["ChatInvite"] = Relationship(
         back_populates="invited_by", passive_deletes="all"
     )
 
-    # Unique constraint
-    class Config:
-        json_schema_extra = {
-            "indexes": [
-                {"fields": ["account_id", "chat_id"], "unique": True},
-                {"fields": ["account_id", "status"]},
-                {"fields": ["chat_id", "role"]},
-            ]
-        }
-
 
 class MessageBase(AppSQLModel):
-    message_type: MessageType = Field(default=MessageType.TEXT, index=True)
-    content: Optional[str] = None  # Text content
+    message_type: MessageType = Field(default=MessageType.TEXT)
+    # TOAST compression is lz4 for both columns (set in DDL, info is a marker)
+    content: Optional[str] = Field(
+        default=None, sa_column_kwargs={"info": {"compression": "lz4"}}
+    )  # Text content
     file_url: Optional[str] = Field(max_length=500, default=None)  # For files/images
     file_name: Optional[str] = Field(max_length=255, default=None)
     file_size: Optional[int] = None
@@ -164,15 +183,42 @@ class MessageBase(AppSQLModel):
         ),
     )
     extra_data: Optional[dict[str, Any]] = Field(
-        default=None, sa_column=Column(JSONB)
+        # none_as_null: None is SQL NULL, not the JSON 'null' value, so the
+        # partial GIN index skips messages without extra data.
+        default=None,
+        sa_column=Column(JSONB(none_as_null=True), info={"compression": "lz4"}),
     )  # Extra data
 
 
 class Message(AppBaseModelMixin, MessageBase, table=True):
-    __table_args__ = (Index("ix_chat_created_at", "chat_id", "created_at"),)
+    # Per-table autovacuum settings for this append-mostly table are applied
+    # in the message_autovacuum migration.
+    __table_args__ = (
+        # Newest-first keyset pagination per chat, see ChatService.list_messages.
+        Index(
+            "ix_chat_created_at_desc",
+            "chat_id",
+            desc("created_at"),
+            "id",
+            postgresql_include=["sender_id", "message_type", "is_deleted"],
+        ),
+        # Serves containment filters, i.e. Message.extra_data.op("@>")({...});
+        # ->/->> comparisons cannot use it.
+        Index(
+            "ix_messages_extra_data_gin",
+            "extra_data",
+            postgresql_using="gin",
+            postgresql_ops={"extra_data": "jsonb_path_ops"},
+            postgresql_where=text("extra_data IS NOT NULL"),
+        ),
+    )
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    chat_id: uuid.UUID = Field(foreign_key="chat.id", index=True, ondelete="CASCADE")
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4,
+        primary_key=True,
+        sa_column_kwargs=UUID_SERVER_DEFAULT,
+    )
+    chat_id: uuid.UUID = Field(foreign_key="chat.id", ondelete="CASCADE")
     sender_id: Optional[uuid.UUID] = Field(
         foreign_key="chat_member.id", index=True, default=None, ondelete="SET NULL"
     )  # Null for system messages
@@ -189,34 +235,27 @@ class Message(AppBaseModelMixin, MessageBase, table=True):
         back_populates="messages",
         sa_relationship_kwargs={"lazy": "selectin"},
     )
+    # Rarely needed in bulk: load explicitly or fail loudly.
     reply_to: Optional["Message"] = Relationship(
         back_populates="replies",
         sa_relationship_kwargs={
             "remote_side": "Message.id",
+            "lazy": "raise_on_sql",
         },
     )
     replies: list["Message"] = Relationship(
         back_populates="reply_to",
         sa_relationship_kwargs={
             "overlaps": "reply_to",
+            "lazy": "raise_on_sql",
         },
     )
     reactions: list["MessageReaction"] = Relationship(
-        back_populates="message", cascade_delete=True
+        back_populates="message",
+        cascade_delete=True,
+        sa_relationship_kwargs={"lazy": "selectin"},
     )
 
-    # Indexes
-    class Config:
-        json_schema_extra = {
-            "indexes": [
-                {"fields": ["chat_id", "created_at"]},
-                {"fields": ["sender_id"]},
-                {"fields": ["message_type"]},
-                # {"fields": ["reply_to_id"]},
-                # {"fields": ["is_deleted"]},
-            ]
-        }
-
 
 class MessageReactionBase(AppSQLModel):
     emoji: str = Field(max_length=10)  # Emoji unicode or shortcode
@@ -226,12 +265,24 @@ class MessageReaction(AppBaseModelMixin, MessageReactionBase, table=True):
     __tablename__: str = "message_reaction"
 
     __table_args__ = (
-        UniqueConstraint("account_id", "message_id", name="uix_account_message"),
-        Index("ix_message_emoji", "message_id", "emoji"),
+        UniqueConstraint(
+            "account_id", "message_id", "emoji", name="uix_account_message_emoji"
+        ),
+        # Per-message emoji counts are answered from the index alone.
+        Index(
+            "ix_message_emoji",
+            "message_id",
+            "emoji",
+            postgresql_include=["account_id"],
+        ),
     )
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    message_id: uuid.UUID = Field(foreign_key="message.id", index=True)
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4,
+        primary_key=True,
+        sa_column_kwargs=UUID_SERVER_DEFAULT,
+    )
+    message_id: uuid.UUID = Field(foreign_key="message.id")
     account_id: uuid.UUID = Field(
         foreign_key="account.id", index=True, ondelete="CASCADE"
     )
@@ -243,20 +294,11 @@ class MessageReaction(AppBaseModelMixin, MessageReactionBase, table=True):
         sa_relationship_kwargs={"lazy": "selectin"},
     )
 
-    # Unique constraint - one reaction per user per message per emoji
-    class Config:
-        json_schema_extra = {
-            "indexes": [
-                {"fields": ["account_id", "message_id"], "unique": True},
-                {"fields": ["message_id", "emoji"]},
-            ]
-        }
-
 
 class ChatInviteBase(AppSQLModel):
     invite_code: Optional[str] = Field(
-        max_length=50, unique=True, index=True, default=None
-    )  # Public invite link
+        max_length=50, default=None
+    )  # Public invite link, unique among active invites
     email: Optional[str] = Field(default=None)
     max_uses: Optional[int] = Field(default=None, ge=1)  # Limit uses for invite code
     current_uses: int = Field(default=0, ge=0)
@@ -273,7 +315,26 @@ class ChatInviteBase(AppSQLModel):
 class ChatInvite(AppBaseModelMixin, ChatInviteBase, table=True):
     __tablename__: str = "chat_invite"
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    # Partial on is_active only: now() is not immutable, so expiry stays a
+    # query-time check rather than part of the index predicate. Codes only
+    # need to be unique while live; retired ones drop out of the index.
+    __table_args__ = (
+        Index(
+            "ix_chat_invite_live_code",
+            "invite_code",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_chat_invite_chat_live", "chat_id", postgresql_where=text("is_active")
+        ),
+    )
+
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4,
+        primary_key=True,
+        sa_column_kwargs=UUID_SERVER_DEFAULT,
+    )
     chat_id: uuid.UUID = Field(foreign_key="chat.id", index=True)
     invited_by_id: uuid.UUID = Field(foreign_key="chat_member.id", ondelete="CASCADE")
     invited_account_id: Optional[uuid.UUID] = Field(
@@ -291,17 +352,6 @@ class ChatInvite(AppBaseModelMixin, ChatInviteBase, table=True):
         sa_relationship_kwargs={"lazy": "selectin"},
     )
 
-    # Indexes
-    class Config:
-        json_schema_extra = {
-            "indexes": [
-                {"fields": ["chat_id", "is_active"]},
-                # {"fields": ["invited_account_id"]},
-                {"fields": ["invite_code"]},
-                # {"fields": ["expires_at"]},
-            ]
-        }
-
 
 # class ChatRead(AppSQLModel):
 #     id: int
@@ -5,10 +5,10 @@
 import uuid
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import BigInteger, Column, Identity, Index, UniqueConstraint
 from sqlmodel import Field, Relationship
 
-from app.models.base import AppBaseModelMixin, AppSQLModel
+from app.models.base import UUID_SERVER_DEFAULT, AppBaseModelMixin, AppSQLModel
 
 if TYPE_CHECKING:
     from .courses_model import Course
@@ -24,10 +24,13 @@ class Rating(AppBaseModelMixin, RatingBase, table=True):
     __table_args__ = (
         UniqueConstraint("account_id", "course_id", name="uix_account_course"),
     )
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    account_id: uuid.UUID = Field(
-        foreign_key="account.id", index=True, ondelete="CASCADE"
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4,
+        primary_key=True,
+        sa_column_kwargs=UUID_SERVER_DEFAULT,
     )
+    # Lookups by account_id use uix_account_course's leading column.
+    account_id: uuid.UUID = Field(foreign_key="account.id", ondelete="CASCADE")
     course_id: Optional[str] = Field(
         foreign_key="course.id", index=True, default=None, ondelete="SET NULL"
     )
@@ -44,23 +47,22 @@ class Rating(AppBaseModelMixin, RatingBase, table=True):
         back_populates="rating", sa_relationship_kwargs={"lazy": "selectin"}
     )
 
-    # unique constraint
-    class Config:
-        json_schema_extra = {
-            "indexes": [
-                {"fields": ["account_id", "course_id"], "unique": True},
-                {"fields": ["course_id"]},
-                {"fields": ["account_id"]},
-            ]
-        }
-
 
 class CommentBase(AppSQLModel):
     message: str
 
 
 class Comment(AppBaseModelMixin, CommentBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    # Threads are one level deep: reply_to_id always points at the thread's
+    # root comment (see CourseService.create_comment), so a whole thread is a
+    # single range on this index.
+    __table_args__ = (Index("ix_comment_thread_created", "reply_to_id", "created_at"),)
+
+    id: uuid.UUID = Field(
+        default_factory=uuid.uuid4,
+        primary_key=True,
+        sa_column_kwargs=UUID_SERVER_DEFAULT,
+    )
     creator_id: uuid.UUID = Field(
         foreign_key="account.id", index=True, ondelete="CASCADE"
     )
@@ -99,10 +101,13 @@ class Comment(AppBaseModelMixin, CommentBase, table=True):
         },
     )
 
+    # Replies are paged through CourseService.list_replies, never walked from
+    # the parent, so neither collection below is loaded by default.
     replies: list["Comment"] = Relationship(
         back_populates="reply_to",
         sa_relationship_kwargs={
             "overlaps": "reply_to",
+            "lazy": "raise_on_sql",
         },
     )
 
@@ -117,7 +122,10 @@ class Comment(AppBaseModelMixin, CommentBase, table=True):
 
     comment_likes: list["CommentLike"] = Relationship(
         back_populates="comment",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+        sa_relationship_kwargs={
+            "cascade": "all, delete-orphan",
+            "lazy": "raise_on_sql",
+        },
     )
 
 
@@ -127,7 +135,12 @@ class CommentLike(AppBaseModelMixin, table=True):
         UniqueConstraint("account_id", "comment_id", name="uix_account_comment"),
     )
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    # Never exposed or referenced, so a BIGINT identity instead of a UUID: half
+    # the key width on the largest comment table.
+    id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(always=False), primary_key=True),
+    )
     account_id: uuid.UUID = Field(
         foreign_key="account.id", index=True, ondelete="CASCADE"
     )
@@ -1,10 +1,10 @@
-import base64
+import secrets
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import DateTime, Index, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import DateTime, Index, Text, UniqueConstraint, desc, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlmodel import Column, Field, Relationship, SQLModel
 
 from app.common.enum import (
@@ -55,70 +55,111 @@ class CourseBase(AppSQLModel):
     )
     learning_objectives: Optional[list[str]] = Field(
         default=None,
-        sa_column=Column(JSONB),
+        sa_column=Column(ARRAY(Text)),
         description="course learning object (optional)",
     )
-    prerequisites: Optional[list[str]] = Field(default=None, sa_column=Column(JSONB))
+    prerequisites: Optional[list[str]] = Field(
+        default=None, sa_column=Column(ARRAY(Text))
+    )
     difficulty_level: DifficultyLevel = Field(
         default=DifficultyLevel.BEGINNER, index=True
     )
     estimated_duration_hours: Optional[int] = None
     language: str = Field(default="en", max_length=10)
-    status: CourseStatus = Field(default=CourseStatus.DRAFT, index=True)
+    status: CourseStatus = Field(default=CourseStatus.DRAFT)
     enrollment_type: EnrollmentType = Field(default=EnrollmentType.OPEN)
     visibility: VisibilityType = Field(default=VisibilityType.PUBLIC)
     certification_enabled: bool = Field(default=False)
 
 
+def generate_course_id() -> str:
+    """Short public course id: 8 random bytes, urlsafe base64 (11 chars)."""
+    return secrets.token_urlsafe(8)
+
+
 class Course(AppBaseModelMixin, CourseBase, table=True):
     __table_args__ = (
         Index("ix_search_filter", "title", "status", "visibility", "enrollment_type"),
+        # The public catalogue, newest first. Drafts, archived and private
+        # courses are never listed, so they stay out of the index.
+        Index(
+            "ix_course_catalogue",
+            desc("created_at"),
+            postgresql_where=text("status = 'PUBLISHED' AND visibility = 'PUBLIC'"),
+        ),
+        # Same slice for the "top rated" / popular and "most enrolled" sorts.
+        Index(
+            "ix_course_catalogue_rating",
+            desc("average_rating"),
+            desc("comment_count"),
+            desc("enrollment_count"),
+            desc("created_at"),
+            postgresql_where=text("status = 'PUBLISHED' AND visibility = 'PUBLIC'"),
+        ),
+        Index(
+            "ix_course_catalogue_enrolled",
+            desc("enrollment_count"),
+            postgresql_where=text("status = 'PUBLISHED' AND visibility = 'PUBLIC'"),
+        ),
     )
 
-    id: str = Field(
-        default_factory=lambda: base64.urlsafe_b64encode(
-            str(uuid.uuid4()).encode()
-        ).decode()[:7],
-        primary_key=True,
-    )
+    id: str = Field(default_factory=generate_course_id, primary_key=True)
     account_id: Optional[uuid.UUID] = Field(
-        foreign_key="account.id", ondelete="SET NULL"
+        foreign_key="account.id", index=True, ondelete="SET NULL"
     )
     slug: str = Field(unique=True, index=True)
+    # Maintained by database triggers on rating / course_enrollment / comment
+    # inserts and deletes (see the course_counter_triggers migration); never
+    # written by the app.
     average_rating: float = Field(default=0.00)
     total_rating: int = Field(default=0)
     stars: int = Field(default=0)
     enrollment_count: int = Field(default=0)
     comment_count: int = Field(default=0)
 
+    # author and tags are loaded per query with selectinload where a course is
+    # serialized; lookups that only need the course row don't pay for them.
     author: Optional["Account"] = Relationship(
         back_populates="courses",
-        sa_relationship_kwargs={"lazy": "selectin"},
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
     )
     sections: list["Section"] = Relationship(
         back_populates="course",
         passive_deletes="all",
         sa_relationship_kwargs={
             "order_by": "Section.order_index",
+            "lazy": "raise_on_sql",
         },
     )
     enrollments: list["CourseEnrollment"] = Relationship(
-        back_populates="course", passive_deletes="all"
+        back_populates="course",
+        passive_deletes="all",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
     )
     progress_records: list["CourseProgress"] = Relationship(
-        back_populates="course", passive_deletes="all"
+        back_populates="course",
+        passive_deletes="all",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
+    )
+    chats: list["Chat"] = Relationship(
+        back_populates="course",
+        passive_deletes="all",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
     )
-    chats: list["Chat"] = Relationship(back_populates="course", passive_deletes="all")
     ratings: list["Rating"] = Relationship(
-        back_populates="course", passive_deletes="all"
+        back_populates="course",
+        passive_deletes="all",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
     )
     comments: list["Comment"] = Relationship(
-        back_populates="course", passive_deletes="all"
+        back_populates="course",
+        passive_deletes="all",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
     )
     tags: list["Tag"] = Relationship(
         back_populates="courses",
         link_model=CourseTag,
-        sa_relationship_kwargs={"lazy": "selectin"},
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
     )
 
 
@@ -142,33 +183,37 @@ class SectionBase(AppSQLModel):
     title: str = Field(max_length=255)
     description: Optional[str] = None
     learning_objectives: Optional[list[str]] = Field(
-        default=None, sa_column=Column(JSONB)
+        default=None, sa_column=Column(ARRAY(Text))
     )
-    order_index: int = Field(index=True)
+    order_index: int
     estimated_duration_minutes: Optional[int] = None
     is_optional: bool = Field(default=False)
     progression_type: ProgressionType = Field(default=ProgressionType.SEQUENTIAL)
     completion_criteria: Optional[list[str]] = Field(
-        default=None, sa_column=Column(JSONB)
+        default=None, sa_column=Column(ARRAY(Text))
     )
 
 
 class Section(AppBaseModelMixin, SectionBase, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    course_id: str = Field(foreign_key="course.id", index=True, ondelete="CASCADE")
+    course_id: str = Field(foreign_key="course.id", ondelete="CASCADE")
 
     # Relationships
-    course: Course = Relationship(back_populates="sections")
+    course: Course = Relationship(
+        back_populates="sections", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
     modules: list["Module"] = Relationship(
         back_populates="section",
         passive_deletes="all",
         sa_relationship_kwargs={
             "order_by": "Module.order_index",
+            "lazy": "raise_on_sql",
         },
     )
 
+    # The unique constraint's index serves every lookup by course_id and
+    # every ordered walk of a course's sections.
     __table_args__ = (
-        Index("ix_course_order", "course_id", "order_index"),
         UniqueConstraint("course_id", "order_index", name="uq_course_order"),
     )
 
@@ -180,45 +225,63 @@ class ModuleBase(AppSQLModel):
     content_data: Optional[dict[str, Any]] = Field(
         default=None, sa_column=Column(JSONB)
     )
-    order_index: int = Field(index=True)
+    order_index: int
     estimated_duration_minutes: Optional[int] = None
     is_required: bool = Field(default=True)
-    prerequisites: Optional[list[str]] = Field(default=None, sa_column=Column(JSONB))
+    prerequisites: Optional[list[str]] = Field(
+        default=None, sa_column=Column(ARRAY(Text))
+    )
     settings: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))
 
 
 class Module(AppBaseModelMixin, ModuleBase, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
-    section_id: uuid.UUID = Field(
-        foreign_key="section.id", index=True, ondelete="CASCADE"
-    )
+    section_id: uuid.UUID = Field(foreign_key="section.id", ondelete="CASCADE")
 
-    section: Section = Relationship(back_populates="modules")
+    section: Section = Relationship(
+        back_populates="modules", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
+    # Content is eager-loaded (MODULE_READ_OPTIONS) where a module is
+    # serialized and removed by the ON DELETE CASCADE foreign keys, never
+    # lazily.
     video_content: Optional["VideoContent"] = Relationship(
         back_populates="module",
+        passive_deletes=True,
         sa_relationship_kwargs={
             "uselist": False,
             "cascade": "all, delete-orphan",
+            "lazy": "raise_on_sql",
         },
     )
     document_content: Optional["DocumentContent"] = Relationship(
         back_populates="module",
-        sa_relationship_kwargs={"uselist": False, "cascade": "all, delete-orphan"},
+        passive_deletes=True,
+        sa_relationship_kwargs={
+            "uselist": False,
+            "cascade": "all, delete-orphan",
+            "lazy": "raise_on_sql",
+        },
     )
     quiz_content: Optional["QuizContent"] = Relationship(
         back_populates="module",
-        sa_relationship_kwargs={"uselist": False, "cascade": "all, delete-orphan"},
+        passive_deletes=True,
+        sa_relationship_kwargs={
+            "uselist": False,
+            "cascade": "all, delete-orphan",
+            "lazy": "raise_on_sql",
+        },
     )
 
     attachments: list["ModuleAttachment"] = Relationship(
-        back_populates="module", passive_deletes="all"
+        back_populates="module",
+        passive_deletes="all",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
     )
-    module_type: ModuleType = Field(index=True)
+    module_type: ModuleType
 
-    # 💡 Composite index for ordering
+    # Likewise serves lookups by section_id and ordered module walks.
     __table_args__ = (
-        Index("ix_section_order", "section_id", "order_index"),
         UniqueConstraint("section_id", "order_index", name="uq_section_order"),
     )
 
@@ -321,12 +384,18 @@ class QuizContent(AppBaseModelMixin, QuizContentBase, table=True):
     )
 
     # Relationships
-    module: Module = Relationship(back_populates="quiz_content")
+    module: Module = Relationship(
+        back_populates="quiz_content", sa_relationship_kwargs={"lazy": "raise_on_sql"}
+    )
     questions: list["QuizQuestion"] = Relationship(
-        back_populates="quiz", passive_deletes="all"
+        back_populates="quiz",
+        passive_deletes="all",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
     )
     attempts: list["QuizAttempt"] = Relationship(
-        back_populates="quiz", passive_deletes="all"
+        back_populates="quiz",
+        passive_deletes="all",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
     )
 
 
@@ -355,7 +424,7 @@ class QuizQuestion(AppBaseModelMixin, QuizQuestionBase, table=True):
 
 
 class CourseEnrollmentBase(AppSQLModel):
-    status: EnrollmentStatus = Field(default=EnrollmentStatus.ACTIVE, index=True)
+    status: EnrollmentStatus = Field(default=EnrollmentStatus.ACTIVE)
 
 
 # Progress tracking models
@@ -364,17 +433,25 @@ class CourseEnrollment(CourseEnrollmentBase, table=True):
 
     __table_args__ = (
         UniqueConstraint("account_id", "course_id", name="ix_enroll_account_course"),
+        # A learner's enrollments, newest first; completion_date is included
+        # so the dashboard's completed/in-progress counts never visit the heap.
+        Index(
+            "ix_enroll_account_date",
+            "account_id",
+            desc("enrollment_date"),
+            postgresql_include=["completion_date"],
+        ),
     )
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    account_id: uuid.UUID = Field(
-        foreign_key="account.id", index=True, ondelete="CASCADE"
-    )
+    account_id: uuid.UUID = Field(foreign_key="account.id", ondelete="CASCADE")
     course_id: Optional[str] = Field(
         foreign_key="course.id", index=True, ondelete="SET NULL"
     )
     enrollment_date: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
-        sa_column=Column(DateTime(timezone=True), nullable=False),
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), nullable=False, server_default=func.now()
+        ),
     )
     completion_date: Optional[datetime] = Field(
         default=None,
@@ -385,20 +462,16 @@ class CourseEnrollment(CourseEnrollmentBase, table=True):
     )
     progress_percentage: float = Field(default=0.0, ge=0, le=100)
     last_accessed: datetime = Field(
-        default_factory=lambda: datetime.now(tz=timezone.utc),
-        sa_column=Column(DateTime(timezone=True), nullable=False),
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), nullable=False, server_default=func.now()
+        ),
     )
 
     # Relationships
     course: Optional[Course] = Relationship(back_populates="enrollments")
     account: "Account" = Relationship(back_populates="enrollments")
 
-    # Unique constraint
-    class Config:
-        json_schema_extra = {
-            "indexes": [{"fields": ["account_id", "course_id"], "unique": True}]
-        }
-
 
 class CourseProgressBase(AppSQLModel):
     status: ModuleProgressStatus = Field(
@@ -444,27 +517,25 @@ class CourseProgress(AppBaseModelMixin, CourseProgressBase, table=True):
     )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    account_id: uuid.UUID = Field(
-        foreign_key="account.id", index=True, ondelete="CASCADE"
-    )
+    account_id: uuid.UUID = Field(foreign_key="account.id", ondelete="CASCADE")
+    # Progress is meaningless without its course, so it goes with it.
     course_id: Optional[str] = Field(
-        foreign_key="course.id", index=True, ondelete="SET NULL"
+        foreign_key="course.id", index=True, ondelete="CASCADE"
     )
 
     # Relationships
     course: Optional[Course] = Relationship(back_populates="progress_records")
     account: "Account" = Relationship(back_populates="progress_records")
 
-    # Unique constraint
-    class Config:
-        json_schema_extra = {
-            "indexes": [{"fields": ["account_id", "course_id"], "unique": True}]
-        }
-
 
 class QuizAttemptBase(AppSQLModel):
     attempt_number: int = Field(ge=1)
-    start_time: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    start_time: datetime = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), nullable=False, server_default=func.now()
+        ),
+    )
     completion_time: Optional[datetime] = Field(
         default=None,
         sa_column=Column(
@@ -473,17 +544,19 @@ class QuizAttemptBase(AppSQLModel):
         ),
     )
     score: Optional[float] = Field(default=None, ge=0, le=100)
-    answers: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))
     status: QuizAttemptStatus = Field(default=QuizAttemptStatus.IN_PROGRESS)
 
 
 class QuizAttempt(QuizAttemptBase, table=True):
     __tablename__: str = "quiz_attempt"
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    account_id: uuid.UUID = Field(
-        foreign_key="account.id", index=True, ondelete="CASCADE"
+    # Also serves "latest attempt" lookups by scanning backwards.
+    __table_args__ = (
+        UniqueConstraint("account_id", "quiz_id", "attempt_number", name="uq_attempt"),
     )
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    account_id: uuid.UUID = Field(foreign_key="account.id", ondelete="CASCADE")
     quiz_id: Optional[uuid.UUID] = Field(
         foreign_key="quiz_content.id", index=True, ondelete="SET NULL"
     )
@@ -491,6 +564,37 @@ class QuizAttempt(QuizAttemptBase, table=True):
     # Relationships
     quiz: Optional[QuizContent] = Relationship(back_populates="attempts")
     account: "Account" = Relationship(back_populates="quizes")
+    answers: list["QuizAnswer"] = Relationship(
+        back_populates="attempt",
+        passive_deletes="all",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
+    )
+
+
+class QuizAnswerBase(AppSQLModel):
+    answer: Optional[dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))
+    is_correct: Optional[bool] = None
+    points: Optional[float] = Field(default=None, ge=0)
+
+
+class QuizAnswer(QuizAnswerBase, table=True):
+    """One row per answered question, so grading and per-question analytics
+    work on indexed rows instead of unpacking a JSONB blob per attempt."""
+
+    __tablename__: str = "quiz_answer"
+
+    attempt_id: uuid.UUID = Field(
+        foreign_key="quiz_attempt.id", primary_key=True, ondelete="CASCADE"
+    )
+    question_id: uuid.UUID = Field(
+        foreign_key="quiz_question.id",
+        primary_key=True,
+        index=True,
+        ondelete="CASCADE",
+    )
+
+    # Relationships
+    attempt: QuizAttempt = Relationship(back_populates="answers")
 
 
 # save
@@ -70,12 +70,3 @@ class Notification(AppBaseModelMixin, NotificationBase, table=True):
     )
 
     account: "Account" = Relationship(back_populates="notifications")
-
-    class Config:
-        json_schema_extra = {
-            "indexes": [
-                {"fields": ["account_id", "is_read"]},
-                {"fields": ["type"]},
-                {"fields": ["ref_id", "ref_model"]},
-            ]
-        }
@@ -2,6 +2,7 @@ import base64
 import hashlib
 import uuid
 from datetime import datetime
+from functools import cache
 from typing import TYPE_CHECKING, Optional
 
 from cryptography.fernet import Fernet
@@ -16,18 +17,21 @@ if TYPE_CHECKING:
     from .user_model import Account
 
 
-fernet_key = base64.urlsafe_b64encode(
-    hashlib.sha256((SECRET_KEY or "").encode()).digest()
-)
-fernet = Fernet(fernet_key)
+@cache
+def _fernet() -> Fernet:
+    """Build the token cipher once per process, on first use."""
+    fernet_key = base64.urlsafe_b64encode(
+        hashlib.sha256((SECRET_KEY or "").encode()).digest()
+    )
+    return Fernet(fernet_key)
 
 
 def encrypt_token(token: str) -> str:
-    return fernet.encrypt(token.encode()).decode()
+    return _fernet().encrypt(token.encode()).decode()
 
 
 def decrypt_token(token_encrypted: str) -> str:
-    return fernet.decrypt(token_encrypted.encode()).decode()
+    return _fernet().decrypt(token_encrypted.encode()).decode()
 
 
 class ProviderBase(AppSQLModel):
@@ -35,7 +35,14 @@ from app.common.utils import (
     extract_redirect_uri,
     generate_random_username,
 )
-from app.core.security import create_jwt_token, decode_token, oauth, verify_state
+from app.core.security import (
+    GITHUB_SCOPE,
+    GOOGLE_SCOPE,
+    create_jwt_token,
+    decode_token,
+    oauth,
+    verify_state,
+)
 from app.models.provider_model import Provider
 from app.models.user_model import Account, Profile
 from app.schemas.account import AccessToken, RefreshToken
@@ -58,7 +65,7 @@ async def google_one_tap(
         Providers.GOOGLE,
         sub,
         background_tasks,
-        "openid email profile",
+        GOOGLE_SCOPE,
         {"redirect": redirect or "/en"},
     )
 
@@ -157,7 +164,7 @@ async def github_callback_handler(
         Providers.GITHUB,
         provider_id,
         background_tasks,
-        "read:user user:email",
+        GITHUB_SCOPE,
         state_data,
     )
 
@@ -727,7 +734,7 @@ async def manual_oauth_callback(
     elif not provider:
         provider = Provider(
             provider=Providers.GOOGLE, account=current_user
-        )  # type:  ignore
+        )  # type: ignore
 
     set_provider_tokens(
         provider,
@@ -789,7 +796,7 @@ async def add_github_account(
     elif not provider:
         provider = Provider(
             provider=Providers.GITHUB, account=current_user
-        )  # type:  ignore
+        )  # type: ignore
 
     set_provider_tokens(provider, None, None, scopes, provider_id)
     session.add(provider)
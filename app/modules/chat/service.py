@@ -1,16 +1,22 @@
+import asyncio
 import json
+import logging
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 from fastapi import BackgroundTasks, HTTPException, WebSocketException
-from sqlalchemy.orm import selectinload
-from sqlmodel import and_, asc, col, desc, func, or_, select
+from sqlalchemy import Uuid, column, exists, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import and_, asc, col, delete, desc, func, or_, select, tuple_, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.common.constants import BASE_URL, PER_PAGE
 from app.common.email_utils import send_email
 from app.common.enum import ChatType, GroupChatPrivacy, MemberRole, MemberStatus
+from app.common.redis_client import get_redis
 from app.common.utils import (
     CursorPaginationSerializer,
     generate_base_64_encoded_uuid,
@@ -20,6 +26,7 @@ from app.common.utils import (
 )
 from app.common.ws_manager import manager
 from app.i18n import translation
+from app.models.base import utcnow
 from app.models.chat_model import Chat, ChatInvite, ChatMember, Message, MessageReaction
 from app.models.courses_model import Course, CourseEnrollment
 from app.models.notification_model import Notification, NotificationType
@@ -39,6 +46,41 @@ from app.schemas.chat import (
 )
 from app.schemas.notification import NotificationWrite
 
+# Everything ChatMessageRead serializes, loaded in a fixed number of queries.
+# Any other relationship touched on a loaded Message raises instead of
+# lazily issuing one query per row.
+MESSAGE_READ_OPTIONS = (
+    selectinload(Message.sender)
+    .selectinload(ChatMember.account)
+    .selectinload(Account.profile),
+    selectinload(Message.reactions)
+    .selectinload(MessageReaction.account)
+    .selectinload(Account.profile),
+    selectinload(Message.chat).selectinload(Chat.account).selectinload(Account.profile),
+    selectinload(Message.chat)
+    .selectinload(Chat.course)
+    .selectinload(Course.author)
+    .selectinload(Account.profile),
+    selectinload(Message.chat).selectinload(Chat.course).selectinload(Course.tags),
+    selectinload(Message.reply_to).raiseload("*"),
+    raiseload("*"),
+)
+
+# Read pointers live in Redis; chat_member.last_read_message_id is a snapshot.
+# The first read in each LAST_READ_PERSIST_INTERVAL is written through; later
+# ones are queued in LAST_READ_DIRTY_KEY and written back by
+# last_read_flush_loop once per interval.
+LAST_READ_TTL = 30 * 24 * 3600
+LAST_READ_PERSIST_INTERVAL = 300
+LAST_READ_DIRTY_KEY = "chat:last_read:dirty"
+LAST_READ_FLUSH_BATCH = 1000
+
+logger = logging.getLogger("app")
+
+
+def _last_read_key(chat_id: Any, account_id: Any) -> str:
+    return f"chat:last_read:{uuid.UUID(str(chat_id))}:{account_id}"
+
 
 class ChatService:
     @staticmethod
@@ -72,43 +114,34 @@ class ChatService:
         query = (
             select(Message)
             .where(Message.chat_id == chat_id)
-            .options(
-                selectinload(Message.sender)
-                .selectinload(ChatMember.account)
-                .selectinload(Account.profile),
-                selectinload(Message.reactions)
-                .selectinload(MessageReaction.account)
-                .selectinload(Account.profile),
-                selectinload(Message.chat)
-                .selectinload(Chat.account)
-                .selectinload(Account.profile),
-                selectinload(Message.chat)
-                .selectinload(Chat.course)
-                .selectinload(Course.author)
-                .selectinload(Account.profile),
-                selectinload(Message.chat)
-                .selectinload(Chat.course)
-                .selectinload(Course.tags),
-            )
+            .options(*MESSAGE_READ_OPTIONS)
         )
         # total_messages = (
         #     await session.exec(select(func.count()).select_from(query.froms[0]))
         # ).one()
 
+        # Keyset on (created_at, id) so ties on created_at are never skipped
+        # and Postgres walks ix_chat_created_at_desc instead of sorting.
+        keyset = tuple_(Message.created_at, Message.id)
+
         if last_message_id:
-            last_message = (
-                await session.exec(select(Message).where(Message.id == last_message_id))
+            cursor = (
+                await session.exec(
+                    select(Message.created_at, Message.id).where(
+                        Message.id == last_message_id
+                    )
+                )
             ).first()
 
-            if last_message and cursor_type == "before":
-                query = query.where(Message.created_at < last_message.created_at)
-            elif last_message and cursor_type == "after":
-                query = query.where(Message.created_at > last_message.created_at)
+            if cursor and cursor_type == "before":
+                query = query.where(keyset < tuple_(*cursor))
+            elif cursor and cursor_type == "after":
+                query = query.where(keyset > tuple_(*cursor))
 
         if q:
             query = query.where(col(Message.content).ilike(f"%{q}%"))
 
-        query = query.order_by(desc(Message.created_at)).limit(limit)
+        query = query.order_by(desc(Message.created_at), desc(Message.id)).limit(limit)
 
         messages = (await session.exec(query)).all()
 
@@ -120,7 +153,12 @@ class ChatService:
         hasNext = bool(
             (
                 await session.exec(
-                    select(Message).where(Message.created_at < last_message.created_at)
+                    select(Message.id)
+                    .where(
+                        Message.chat_id == chat_id,
+                        keyset < tuple_(last_message.created_at, last_message.id),
+                    )
+                    .limit(1)
                 )
             ).first()
         )  # even if it is one message then there is a valid next
@@ -195,14 +233,7 @@ class ChatService:
         last_messages_query = (
             select(Message)
             .where(Message.chat_id.in_(ids))
-            .options(
-                selectinload(Message.sender)
-                .selectinload(ChatMember.account)
-                .selectinload(Account.profile),
-                selectinload(Message.reactions)
-                .selectinload(MessageReaction.account)
-                .selectinload(Account.profile),
-            )
+            .options(*MESSAGE_READ_OPTIONS)
             .order_by(Message.chat_id, desc(Message.created_at))
             .distinct(Message.chat_id)
         )
@@ -269,25 +300,26 @@ class ChatService:
                 )
             )
 
-        # OUTER JOIN so chats without courses are still included
-        query = query.outerjoin(
-            Course, Chat.course_id == Course.id  # type: ignore[arg-type]
-        ).outerjoin(
-            CourseEnrollment, CourseEnrollment.course_id == Course.id  # type: ignore[arg-type]
-        )
-
+        # Semi-joins: each check stops at its first match on a unique key
+        # instead of joining every enrollment of the course.
         query = query.where(
             or_(
-                # User enrolled in the course
-                CourseEnrollment.account_id == current_user.id,
-                # User is the creator of the course
-                Course.account_id == current_user.id,
                 # Chat has no course attached
                 col(Chat.course_id).is_(None),
+                # User enrolled in the course
+                exists().where(
+                    CourseEnrollment.course_id == Chat.course_id,
+                    CourseEnrollment.account_id == current_user.id,
+                ),
+                # User is the creator of the course
+                exists().where(
+                    Course.id == Chat.course_id,
+                    Course.account_id == current_user.id,
+                ),
             )
         )
 
-        query.order_by(desc(Chat.last_message_at))
+        query = query.order_by(desc(Chat.last_message_at))
 
         return await paginate(session, query, page, per_page)
 
@@ -331,7 +363,8 @@ class ChatService:
         session.add(member)
         await session.commit()
 
-        # Reload chat with account.profile and course for ChatRead
+        # Reload chat with account.profile and course for ChatRead;
+        # populate_existing picks up the trigger-maintained member_count.
         chat = (
             await session.exec(
                 select(Chat)
@@ -343,6 +376,7 @@ class ChatService:
                     .selectinload(Account.profile),
                     selectinload(Chat.course).selectinload(Course.tags),
                 )
+                .execution_options(populate_existing=True)
             )
         ).first()
         if not chat:
@@ -460,39 +494,17 @@ class ChatService:
         cleaned_data = data.model_dump()
         message = Message(**cleaned_data, sender_id=current_member.id)
         session.add(message)
-        await session.flush()
+        await session.commit()
 
+        # message_count and last_message_at were bumped by the message trigger
         await session.refresh(chat)
 
-        if message.created_at > chat.last_message_at:
-            chat.last_message_at = message.created_at
-            session.add(chat)
-
-        await session.commit()
-
         # Reload message with all relationships
         message = (
             await session.exec(
                 select(Message)
                 .where(Message.id == message.id)
-                .options(
-                    selectinload(Message.sender)
-                    .selectinload(ChatMember.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.reactions)
-                    .selectinload(MessageReaction.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.course)
-                    .selectinload(Course.author)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.course)
-                    .selectinload(Course.tags),
-                )
+                .options(*MESSAGE_READ_OPTIONS)
             )
         ).first()
 
@@ -514,24 +526,7 @@ class ChatService:
                     Message.id == message_id,
                     ChatMember.account_id == current_user.id,
                 )
-                .options(
-                    selectinload(Message.sender)
-                    .selectinload(ChatMember.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.reactions)
-                    .selectinload(MessageReaction.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.course)
-                    .selectinload(Course.author)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.course)
-                    .selectinload(Course.tags),
-                )
+                .options(*MESSAGE_READ_OPTIONS)
             )
         ).first()
 
@@ -554,24 +549,7 @@ class ChatService:
             await session.exec(
                 select(Message)
                 .where(Message.id == message.id)
-                .options(
-                    selectinload(Message.sender)
-                    .selectinload(ChatMember.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.reactions)
-                    .selectinload(MessageReaction.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.course)
-                    .selectinload(Course.author)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.course)
-                    .selectinload(Course.tags),
-                )
+                .options(*MESSAGE_READ_OPTIONS)
             )
         ).first()
         return message
@@ -588,24 +566,7 @@ class ChatService:
                     Message.id == message_id,
                     ChatMember.account_id == current_user.id,
                 )
-                .options(
-                    selectinload(Message.sender)
-                    .selectinload(ChatMember.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.reactions)
-                    .selectinload(MessageReaction.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.course)
-                    .selectinload(Course.author)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.course)
-                    .selectinload(Course.tags),
-                )
+                .options(*MESSAGE_READ_OPTIONS)
             )
         ).first()
 
@@ -625,24 +586,7 @@ class ChatService:
             await session.exec(
                 select(Message)
                 .where(Message.id == message.id)
-                .options(
-                    selectinload(Message.sender)
-                    .selectinload(ChatMember.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.reactions)
-                    .selectinload(MessageReaction.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.account)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.course)
-                    .selectinload(Course.author)
-                    .selectinload(Account.profile),
-                    selectinload(Message.chat)
-                    .selectinload(Chat.course)
-                    .selectinload(Course.tags),
-                )
+                .options(*MESSAGE_READ_OPTIONS)
             )
         ).first()
         if not message:
@@ -698,7 +642,7 @@ class ChatService:
         invite = (
             await session.exec(
                 select(ChatInvite)
-                .where(ChatInvite.invite_code == token)
+                .where(ChatInvite.invite_code == token, ChatInvite.is_active)
                 .options(
                     selectinload(ChatInvite.invited_by)
                     .selectinload(ChatMember.account)
@@ -771,8 +715,10 @@ class ChatService:
         )
         session.add(new_member)
 
-        # increment invite usage
+        # increment invite usage; exhausted invites drop out of the live indexes
         invite.current_uses += 1
+        if invite.max_uses is not None and invite.current_uses >= invite.max_uses:
+            invite.is_active = False
         await session.commit()
 
         # Reload ChatMember with account.profile
@@ -1108,29 +1054,46 @@ class ChatService:
             await session.exec(
                 select(Chat)
                 .where(Chat.chat_type == ChatType.DIRECT)
-                .where(col(Chat.members).any(ChatMember.account_id == current_user.id))  # type: ignore
-                .where(col(Chat.members).any(ChatMember.account_id == target.id))  # type: ignore
+                .where(col(Chat.participant_ids).contains([current_user.id, target.id]))
             )
         ).first()
 
         if existing:
-            return existing
+            chat_id = existing.id
+        else:
+            # create direct chat
+            chat = Chat(
+                chat_type=ChatType.DIRECT,
+                account_id=current_user.id,  # creator
+                course_id=course_id,
+            )
+            session.add(chat)
+            await session.flush()
 
-        # create direct chat
-        chat = Chat(
-            chat_type=ChatType.DIRECT,
-            account_id=current_user.id,  # creator
-            course_id=course_id,
-        )
-        session.add(chat)
-        await session.flush()
+            # add 2 members
+            session.add(ChatMember(chat_id=chat.id, account_id=current_user.id))
+            session.add(ChatMember(chat_id=chat.id, account_id=target.id))
 
-        # add 2 members
-        session.add(ChatMember(chat_id=chat.id, account_id=current_user.id))
-        session.add(ChatMember(chat_id=chat.id, account_id=target.id))
+            await session.commit()
+            chat_id = chat.id
 
-        await session.commit()
-        await session.refresh(chat)
+        # Reload chat with account.profile and course for ChatRead
+        chat = (
+            await session.exec(
+                select(Chat)
+                .where(Chat.id == chat_id)
+                .options(
+                    selectinload(Chat.account).selectinload(Account.profile),
+                    selectinload(Chat.course)
+                    .selectinload(Course.author)
+                    .selectinload(Account.profile),
+                    selectinload(Chat.course).selectinload(Course.tags),
+                )
+                .execution_options(populate_existing=True)
+            )
+        ).first()
+        if not chat:
+            raise HTTPException(404, "Chat not found")
         return chat
 
     @staticmethod
@@ -1199,31 +1162,20 @@ class ChatService:
         - update ChatMember.last_read_message_id
         """
         # Verify chat exists and user is a member
-        await ChatService.get_chat_and_membership_or_raise(
+        _, member = await ChatService.get_chat_and_membership_or_raise(
             chat_id, str(current_user.id), session
         )
 
-        # Get member
-        member = (
+        # message exists & belongs to chat
+        msg_chat_id = (
             await session.exec(
-                select(ChatMember)
-                .where(ChatMember.chat_id == chat_id)
-                .where(ChatMember.account_id == current_user.id)
+                select(Message.chat_id).where(Message.id == uuid.UUID(message_id))
             )
         ).first()
-        if not member:
-            raise HTTPException(403, "You are not a member of this chat")
-
-        # message exists & belongs to chat
-        msg = await session.get(Message, uuid.UUID(message_id))
-        if not msg or str(msg.chat_id) != chat_id:
+        if not msg_chat_id or str(msg_chat_id) != chat_id:
             raise HTTPException(404, "Message not found in this chat")
 
-        # update read pointer
-        member.last_read_message_id = msg.id
-
-        session.add(member)
-        await session.commit()
+        await ChatService.store_last_read(session, member, uuid.UUID(message_id))
         return {"ok": True}
 
     @staticmethod
@@ -1238,40 +1190,26 @@ class ChatService:
         - Sets it as the last read message for the user
         """
         # Verify chat exists and user is a member
-        await ChatService.get_chat_and_membership_or_raise(
+        _, member = await ChatService.get_chat_and_membership_or_raise(
             chat_id, str(current_user.id), session
         )
 
-        # Get member
-        member = (
-            await session.exec(
-                select(ChatMember)
-                .where(ChatMember.chat_id == chat_id)
-                .where(ChatMember.account_id == current_user.id)
-            )
-        ).first()
-        if not member:
-            raise HTTPException(403, "You are not a member of this chat")
-
         # Get the most recent message in the chat
-        latest_message = (
+        latest_message_id = (
             await session.exec(
-                select(Message)
+                select(Message.id)
                 .where(Message.chat_id == chat_id)
-                .order_by(desc(Message.created_at))
+                .order_by(desc(Message.created_at), desc(Message.id))
                 .limit(1)
             )
         ).first()
 
-        if not latest_message:
+        if not latest_message_id:
             # No messages in chat, nothing to mark as read
             return {"ok": True}
 
         # update read pointer to latest message
-        member.last_read_message_id = latest_message.id
-
-        session.add(member)
-        await session.commit()
+        await ChatService.store_last_read(session, member, latest_message_id)
         return {"ok": True}
 
     @staticmethod
@@ -1303,13 +1241,126 @@ class ChatService:
         if not msg or msg.chat_id != chat_id:
             raise HTTPException(404, "Message not found in this chat")
 
-        # update read pointer
-        member.last_read_message_id = msg.id
-
-        session.add(member)
-        await session.commit()
+        await ChatService.store_last_read(session, member, msg.id)
         return {"ok": True}
 
+    @staticmethod
+    async def store_last_read(
+        session: AsyncSession, member: ChatMember, message_id: uuid.UUID
+    ):
+        """
+        Move a member's read pointer.
+        - always written to Redis
+        - the first move per persist interval is written to chat_member now
+        - later ones are queued for flush_last_read
+        """
+        redis = get_redis(decode_responses=True)
+        key = _last_read_key(member.chat_id, member.account_id)
+        await redis.set(key, str(message_id), ex=LAST_READ_TTL)
+
+        if await redis.set(
+            f"{key}:persisted", 1, ex=LAST_READ_PERSIST_INTERVAL, nx=True
+        ):
+            member.last_read_message_id = message_id
+            session.add(member)
+            await session.commit()
+        else:
+            await redis.sadd(
+                LAST_READ_DIRTY_KEY, f"{member.chat_id}:{member.account_id}"
+            )
+
+    @staticmethod
+    async def flush_last_read(session: AsyncSession) -> int:
+        """
+        Write every queued read pointer back to chat_member.
+        - members are popped from the dirty set in batches
+        - each batch is one UPDATE ... FROM (VALUES ...)
+        - a failed batch is re-queued
+        """
+        redis = get_redis(decode_responses=True)
+        flushed = 0
+        while True:
+            members = await redis.spop(LAST_READ_DIRTY_KEY, LAST_READ_FLUSH_BATCH)
+            if not members:
+                return flushed
+
+            pairs = [m.split(":", 1) for m in members]
+            pointers = await redis.mget([_last_read_key(c, a) for c, a in pairs])
+            rows = [
+                (uuid.UUID(c), uuid.UUID(a), uuid.UUID(p))
+                for (c, a), p in zip(pairs, pointers)
+                if p
+            ]
+            if not rows:
+                continue
+
+            pointer_values = values(
+                column("chat_id", Uuid),
+                column("account_id", Uuid),
+                column("message_id", Uuid),
+                name="last_read",
+            ).data(rows)
+            try:
+                await session.exec(
+                    update(ChatMember)
+                    .where(
+                        col(ChatMember.chat_id) == pointer_values.c.chat_id,
+                        col(ChatMember.account_id) == pointer_values.c.account_id,
+                    )
+                    .values(last_read_message_id=pointer_values.c.message_id)
+                    .execution_options(synchronize_session=False)
+                )  # type: ignore
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                await redis.sadd(LAST_READ_DIRTY_KEY, *members)
+                raise
+            flushed += len(rows)
+
+    @staticmethod
+    async def last_read_flush_loop(
+        session_maker: async_sessionmaker[AsyncSession],
+        interval: float = LAST_READ_PERSIST_INTERVAL,
+    ):
+        """Run flush_last_read every interval until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with session_maker() as session:
+                    await ChatService.flush_last_read(session)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Flushing chat read pointers failed")
+
+    @staticmethod
+    async def fetch_last_read(
+        session: AsyncSession, chat_ids: list[uuid.UUID], user_id: uuid.UUID
+    ) -> dict[uuid.UUID, Optional[uuid.UUID]]:
+        """
+        Current read pointer per chat: Redis first, the chat_member snapshot
+        for chats Redis has no entry for.
+        """
+        if not chat_ids:
+            return {}
+
+        redis = get_redis(decode_responses=True)
+        cached = await redis.mget([_last_read_key(c, user_id) for c in chat_ids])
+        last_read: dict[uuid.UUID, Optional[uuid.UUID]] = {
+            c: uuid.UUID(v) for c, v in zip(chat_ids, cached) if v
+        }
+
+        missing = [c for c in chat_ids if c not in last_read]
+        if missing:
+            rows = await session.exec(
+                select(ChatMember.chat_id, ChatMember.last_read_message_id).where(
+                    ChatMember.account_id == user_id,
+                    col(ChatMember.chat_id).in_(missing),
+                )
+            )
+            last_read.update(rows.all())
+        return last_read
+
     @staticmethod
     async def create_delete_reaction(
         session: AsyncSession,
@@ -1328,28 +1379,46 @@ class ChatService:
             str(message.chat_id), str(current_user.id), session
         )
 
-        reaction = (
+        # Toggle: remove the reaction if present, otherwise insert it. The
+        # insert skips on uix_account_message_emoji, so concurrent reacts of
+        # the same emoji never race into an IntegrityError.
+        removed = await session.exec(
+            delete(MessageReaction).where(
+                col(MessageReaction.message_id) == message.id,
+                col(MessageReaction.account_id) == current_user.id,
+                col(MessageReaction.emoji) == data.emoji,
+            )  # type: ignore
+        )
+
+        if not removed.rowcount:
+            now = utcnow()
             await session.exec(
-                select(MessageReaction).where(
-                    MessageReaction.emoji == data.emoji,
-                    MessageReaction.account_id == current_user.id,
+                pg_insert(MessageReaction)
+                .values(
+                    message_id=message.id,
+                    account_id=current_user.id,
+                    emoji=data.emoji,
+                    created_at=now,
+                    updated_at=now,
                 )
+                .on_conflict_do_nothing(
+                    index_elements=["account_id", "message_id", "emoji"]
+                )  # type: ignore
             )
-        ).first()
-
-        if reaction:
-            await session.delete(reaction)
-            await session.commit()
-            await session.refresh(message)
-            return message
 
-        reaction = MessageReaction(**data.model_dump())
-        reaction.account_id = current_user.id
-        reaction.message_id = uuid.UUID(message_id)
-
-        session.add(reaction)
         await session.commit()
-        await session.refresh(message)
+
+        # Reload message with all relationships; reactions just changed.
+        message = (
+            await session.exec(
+                select(Message)
+                .where(Message.id == message.id)
+                .options(*MESSAGE_READ_OPTIONS)
+                .execution_options(populate_existing=True)
+            )
+        ).first()
+        if not message:
+            raise HTTPException(404, "message not found")
         return message
 
     @staticmethod
@@ -1359,67 +1428,44 @@ class ChatService:
         """
         Return unread_count + has_reply for a single chat_id
         """
-
-        # Subquery to get the last read message timestamp for this specific user/chat
-        last_read_subq = (
-            select(Message.created_at)
-            .join(ChatMember, Message.id == ChatMember.last_read_message_id)
-            .where(ChatMember.chat_id == chat_id, ChatMember.account_id == user_id)
-            .scalar_subquery()
-        )
-
-        # Main query to count unread messages
-        query = select(
-            func.count(Message.id).label("unread_count"),
-            func.bool_or(Message.reply_to_id.isnot(None)).label("has_reply"),
-        ).where(
-            Message.chat_id == chat_id,
-            or_(last_read_subq.is_(None), Message.created_at > last_read_subq),
-        )
-
-        result = await session.exec(query)
-        row: Any = result.one_or_none()
-
-        return {
-            "unread_count": row.unread_count if row else 0,
-            "has_reply": row.has_reply if row else False,
-        }
+        chat_uuid = uuid.UUID(str(chat_id))
+        stats = await ChatService.fetch_unread_stats(session, [chat_uuid], user_id)
+        return stats.get(chat_uuid, {"unread_count": 0, "has_reply": False})
 
     @staticmethod
     async def fetch_unread_stats(
         session, chat_ids: list[uuid.UUID], user_id: uuid.UUID
     ):
+        last_read = await ChatService.fetch_last_read(session, chat_ids, user_id)
+        if not last_read:
+            return {}
+
+        # One branch per chat: everything after its read pointer, or the whole
+        # chat if the member has never read it. Each walks ix_chat_created_at_desc.
+        unread = []
+        for chat_id, message_id in last_read.items():
+            if message_id is None:
+                unread.append(Message.chat_id == chat_id)
+            else:
+                unread.append(
+                    and_(
+                        Message.chat_id == chat_id,
+                        Message.created_at
+                        > select(Message.created_at)
+                        .where(Message.id == message_id)
+                        .correlate(None)
+                        .scalar_subquery(),
+                    )
+                )
 
-        # Subquery: unread messages grouped by chat
-        unread_subq = (
+        results = await session.exec(
             select(
                 col(Message.chat_id).label("chat_id"),
                 func.count(col(Message.id)).label("unread_count"),
                 func.bool_or(col(Message.reply_to_id).isnot(None)).label("has_reply"),
             )
-            .join(ChatMember, ChatMember.chat_id == Message.chat_id)  # type: ignore
-            .where(
-                ChatMember.account_id == user_id,
-                or_(
-                    ChatMember.last_read_message_id.is_(None),
-                    Message.created_at
-                    > select(Message.created_at)
-                    .where(Message.id == ChatMember.last_read_message_id)
-                    .correlate(ChatMember)
-                    .scalar_subquery(),
-                ),  # If no last_read, count all messages
-            )
-            .where(col(Message.chat_id).in_(chat_ids))
+            .where(or_(*unread))
             .group_by(col(Message.chat_id))
-            .subquery()
-        )
-
-        results = await session.exec(
-            select(
-                unread_subq.c.chat_id,
-                unread_subq.c.unread_count,
-                unread_subq.c.has_reply,
-            )
         )
 
         rows = results.all()
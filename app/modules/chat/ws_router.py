@@ -2,6 +2,7 @@ import asyncio
 import traceback
 from typing import TYPE_CHECKING, Optional
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, WebSocketException
 
 from app.common.constants import PER_PAGE
@@ -131,13 +132,13 @@ async def connect_to_chat(
     await websocket.accept()
     initial_data = await ChatService.get_initial_data(chat_id, session, current_user)
 
-    await websocket.send_json(
-        {
-            "event": "chat.initial",
-            "data": PaginatedMessages.model_validate(initial_data).model_dump(
-                mode="json"
-            ),
-        }
+    # The page is serialized straight to JSON by pydantic-core and spliced in
+    # as-is, instead of building an intermediate dict tree per message.
+    page_json = PaginatedMessages.model_validate(initial_data).model_dump_json()
+    await websocket.send_text(
+        orjson.dumps(
+            {"event": "chat.initial", "data": orjson.Fragment(page_json)}
+        ).decode()
     )
 
     local_conn = await manager.subscribe_local(chat_id, websocket)
@@ -4,9 +4,9 @@ from typing import Any, Optional, cast
 
 from fastapi import HTTPException, status
 from pydantic import HttpUrl
-from sqlalchemy import BinaryExpression, text
-from sqlalchemy.orm import selectinload
-from sqlmodel import asc, col, desc, func, or_, select, update
+from sqlalchemy import BinaryExpression, exists, text
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlmodel import asc, col, delete, desc, func, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.common.constants import PER_PAGE
@@ -62,6 +62,17 @@ from app.schemas.courses import (
 )
 from app.schemas.media import DocumentItem
 
+# Everything ModuleRead serializes. The content tables are one-to-one
+# (unique module_id), so they ride along as LEFT JOINs on the module query;
+# only the attachments collection costs a second query. These relationships
+# raise if touched unloaded.
+MODULE_READ_OPTIONS = (
+    joinedload(Module.video_content),
+    joinedload(Module.document_content),
+    joinedload(Module.quiz_content),
+    selectinload(Module.attachments),
+)
+
 
 class CourseService:
 
@@ -85,7 +96,6 @@ class CourseService:
                 Course.status == CourseStatus.PUBLISHED,
                 Course.visibility == VisibilityType.PUBLIC,
             )
-            .group_by(Course.id)
             .options(
                 selectinload(Course.author).selectinload(Account.profile),
                 selectinload(Course.tags),
@@ -105,11 +115,13 @@ class CourseService:
         if tags:
             tag_names = [t.strip().lower() for t in tags if t.strip()]
             if tag_names:
-                base_query = (
-                    base_query.join(CourseTag)
-                    .join(Tag)
+                # Semi-join: a course matching several tags is returned once
+                # without joining and regrouping every matching tag row.
+                base_query = base_query.where(
+                    exists()
+                    .where(CourseTag.course_id == Course.id)
+                    .where(CourseTag.tag_id == Tag.id)
                     .where(col(Tag.name).in_(tag_names))
-                    .group_by(Course.id)
                 )
 
         if level:
@@ -161,11 +173,11 @@ class CourseService:
             base_query = base_query.where(Course.language == language)
 
         if sort == SortCoursesBy.MOST_ENROLLED:
-            base_query.order_by(desc(Course.comment_count))
+            base_query = base_query.order_by(desc(Course.enrollment_count))
         elif sort == SortCoursesBy.TOP_RATED:
-            base_query.order_by(desc(Course.average_rating))
+            base_query = base_query.order_by(desc(Course.average_rating))
         else:
-            base_query.order_by(desc(Course.created_at))
+            base_query = base_query.order_by(desc(Course.created_at))
 
         return await paginate(session, base_query, page, per_page)
 
@@ -179,15 +191,20 @@ class CourseService:
 
         statement = (
             select(Course)
-            .join(CourseTag)
-            .join(Tag)
             .where(
-                col(Tag.name).in_(tag.lower()),
+                # Tag names are stored stripped and lower-cased, so a plain
+                # equality on the normalized input is served by ix_tag_name.
+                exists()
+                .where(CourseTag.course_id == Course.id)
+                .where(CourseTag.tag_id == Tag.id)
+                .where(Tag.name == tag.strip().lower()),
                 Course.status == CourseStatus.PUBLISHED,
                 Course.visibility == VisibilityType.PUBLIC,
             )
-            .distinct()  # Remove duplicates if course has multiple matching tags
-            .options(selectinload(Course.author).selectinload(Account.profile))
+            .options(
+                selectinload(Course.author).selectinload(Account.profile),
+                selectinload(Course.tags),
+            )
         )
 
         return await paginate(session, statement, page, per_page)
@@ -210,7 +227,10 @@ class CourseService:
                 desc(Course.enrollment_count),
                 desc(Course.created_at),
             )
-            .options(selectinload(Course.author).selectinload(Account.profile))
+            .options(
+                selectinload(Course.author).selectinload(Account.profile),
+                selectinload(Course.tags),
+            )
         )
 
         return await paginate(session, statement, page, per_page)
@@ -335,21 +355,10 @@ class CourseService:
                     selectinload(Course.sections)
                     .selectinload(Section.course)
                     .selectinload(Course.tags),
-                    # -- course sections modules video content --
+                    # -- course sections modules with their content --
                     selectinload(Course.sections)
                     .selectinload(Section.modules)
-                    .selectinload(Module.video_content),
-                    # -- course sections modules document content --
-                    selectinload(Course.sections)
-                    .selectinload(Section.modules)
-                    .selectinload(Module.document_content),
-                    selectinload(Course.sections)
-                    .selectinload(Section.modules)
-                    .selectinload(Module.attachments),
-                    # -- course sections modules quiz content --
-                    selectinload(Course.sections)
-                    .selectinload(Section.modules)
-                    .selectinload(Module.quiz_content),
+                    .options(*MODULE_READ_OPTIONS),
                 )
             )
         ).first()
@@ -375,11 +384,7 @@ class CourseService:
         session: AsyncSession, data: SectionCreate, current_user: Account
     ):
         course = (
-            await session.exec(
-                select(Course)
-                .where(Course.id == data.course_id)
-                .options(selectinload(Course.author).selectinload(Account.profile))
-            )
+            await session.exec(select(Course).where(Course.id == data.course_id))
         ).first()
 
         if not course:
@@ -410,9 +415,7 @@ class CourseService:
                     .selectinload(Course.author)
                     .selectinload(Account.profile),
                     selectinload(Section.course).selectinload(Course.tags),
-                    selectinload(Section.modules).selectinload(Module.video_content),
-                    selectinload(Section.modules).selectinload(Module.document_content),
-                    selectinload(Section.modules).selectinload(Module.attachments),
+                    selectinload(Section.modules).options(*MODULE_READ_OPTIONS),
                 )
             )
         ).first()
@@ -463,10 +466,7 @@ class CourseService:
                     .selectinload(Course.author)
                     .selectinload(Account.profile),
                     selectinload(Section.course).selectinload(Course.tags),
-                    selectinload(Section.modules).selectinload(Module.video_content),
-                    selectinload(Section.modules).selectinload(Module.document_content),
-                    selectinload(Section.modules).selectinload(Module.attachments),
-                    selectinload(Section.modules).selectinload(Module.quiz_content),
+                    selectinload(Section.modules).options(*MODULE_READ_OPTIONS),
                 )
             )
         ).first()
@@ -486,10 +486,7 @@ class CourseService:
                     .selectinload(Course.author)
                     .selectinload(Account.profile),
                     selectinload(Section.course).selectinload(Course.tags),
-                    selectinload(Section.modules).selectinload(Module.video_content),
-                    selectinload(Section.modules).selectinload(Module.document_content),
-                    selectinload(Section.modules).selectinload(Module.attachments),
-                    selectinload(Section.modules).selectinload(Module.quiz_content),
+                    selectinload(Section.modules).options(*MODULE_READ_OPTIONS),
                 )
             )
         ).first()
@@ -571,10 +568,7 @@ class CourseService:
                 select(Module)
                 .where(Module.id == module.id)
                 .options(
-                    selectinload(Module.video_content),
-                    selectinload(Module.document_content),
-                    selectinload(Module.attachments),
-                    selectinload(Module.quiz_content),
+                    *MODULE_READ_OPTIONS,
                 )
             )
         ).first()
@@ -621,10 +615,7 @@ class CourseService:
                 select(Module)
                 .where(Module.id == module.id)
                 .options(
-                    selectinload(Module.video_content),
-                    selectinload(Module.document_content),
-                    selectinload(Module.attachments),
-                    selectinload(Module.quiz_content),
+                    *MODULE_READ_OPTIONS,
                 )
             )
         ).first()
@@ -690,10 +681,7 @@ class CourseService:
                 .where(Module.id == module_id)
                 .options(
                     selectinload(Module.section).selectinload(Section.course),
-                    selectinload(Module.video_content),
-                    selectinload(Module.document_content),
-                    selectinload(Module.attachments),
-                    selectinload(Module.quiz_content),
+                    *MODULE_READ_OPTIONS,
                 )
             )
         ).first()
@@ -873,15 +861,18 @@ class CourseService:
         current_user: Account,
     ):
 
-        for attachement in attachements:
-            await CourseService._run_module_checks(
-                session, attachement.module_id, current_user.id
-            )
-
-            cleaned_data = attachement.model_dump(exclude_unset=True)
-            obj = ModuleAttachment(**cleaned_data)
-
-            session.add(obj)
+        # Attachments usually share a module: check each module only once.
+        for module_id in dict.fromkeys(a.module_id for a in attachements):
+            await CourseService._run_module_checks(session, module_id, current_user.id)
+
+        # Ids are generated client-side, so the flush needs no RETURNING and
+        # sends all rows as one batched INSERT.
+        session.add_all(
+            [
+                ModuleAttachment(**attachement.model_dump(exclude_unset=True))
+                for attachement in attachements
+            ]
+        )
         await session.commit()
 
     @staticmethod
@@ -959,11 +950,7 @@ class CourseService:
     ):
 
         course = (
-            await session.exec(
-                select(Course)
-                .where(Course.id == data.course_id)
-                .options(selectinload(Course.author).selectinload(Account.profile))
-            )
+            await session.exec(select(Course).where(Course.id == data.course_id))
         ).first()
 
         # TODO: before enrollment check for criteria like pay for paid courses
@@ -986,11 +973,7 @@ class CourseService:
         current_user: Account,
     ):
         course = (
-            await session.exec(
-                select(Course)
-                .where(Course.id == data.course_id)
-                .options(selectinload(Course.author).selectinload(Account.profile))
-            )
+            await session.exec(select(Course).where(Course.id == data.course_id))
         ).first()
         if not course:
             raise HTTPException(
@@ -1045,21 +1028,7 @@ class CourseService:
             rating.account_id = current_user.id
             rating.comment_id = comment.id
             session.add(rating)
-            await session.flush()  # Ensure rating is created
-
-            # Atomically update course statistics using SQLModel's update
-            update_stmt = (
-                update(Course)
-                .where(cast(BinaryExpression, Course.id == data.course_id))
-                .values(
-                    total_rating=func.coalesce(Course.total_rating, 0) + 1,
-                    stars=func.coalesce(Course.stars, 0) + data.star,
-                    average_rating=(func.coalesce(Course.stars, 0) + data.star)
-                    / (func.coalesce(Course.total_rating, 0) + 1),
-                )
-            )
-
-            await session.exec(update_stmt)  # type: ignore
+            # course rating totals are updated by the rating trigger
             await session.commit()
 
             # Reload rating with account.profile and comment for CourseRatingRead
@@ -1101,11 +1070,7 @@ class CourseService:
         current_user: Account,
     ):
         course = (
-            await session.exec(
-                select(Course)
-                .where(Course.id == data.course_id)
-                .options(selectinload(Course.author).selectinload(Account.profile))
-            )
+            await session.exec(select(Course).where(Course.id == data.course_id))
         ).first()
 
         if not course:
@@ -1168,41 +1133,8 @@ class CourseService:
                 comment.creator_id = current_user.id
                 comment.reply_to_id = reply_to_id
                 session.add(comment)
-                await session.flush()
-
-                # comment_count increment
-                upgraded_parent = (
-                    await session.exec(
-                        select(Comment)
-                        .where(Comment.id == reply_to_id)
-                        .options(
-                            selectinload(Comment.account).selectinload(Account.profile),
-                            selectinload(Comment.mention).selectinload(Account.profile),
-                        )
-                    )
-                ).first()
-                assert upgraded_parent is not None
-
-                update_stmt_parent = (
-                    update(Comment)
-                    .where(cast(BinaryExpression, Comment.id == reply_to_id))
-                    .values(
-                        comment_count=func.coalesce(Comment.comment_count, 0) + 1,
-                    )
-                )
-
-                await session.exec(update_stmt_parent)  # type: ignore
-            # increment course comment count
-            # Atomically update course statistics using SQLModel's update
-            update_stmt = (
-                update(Course)
-                .where(cast(BinaryExpression, Course.id == data.course_id))
-                .values(
-                    comment_count=func.coalesce(Course.comment_count, 0) + 1,
-                )
-            )
-
-            await session.exec(update_stmt)  # type: ignore
+            # the parent's and the course's comment_count are bumped by the
+            # comment triggers
             await session.commit()
 
             # Reload comment with account.profile and mention.profile
@@ -1305,32 +1237,30 @@ class CourseService:
             .options(
                 selectinload(Comment.account).selectinload(Account.profile),
                 selectinload(Comment.mention).selectinload(Account.profile),
+                raiseload("*", sql_only=True),
             )
         )
 
         data = await paginate(session, query, page, per_page)
 
         if current_user:
-            likes = (
-                await session.exec(
-                    select(CommentLike, Comment.course_id)
-                    .join(CommentLike)
-                    .where(
-                        Comment.course_id == course_id,
-                        CommentLike.account_id == current_user.id,
+            liked = set(
+                (
+                    await session.exec(
+                        select(CommentLike.comment_id).where(
+                            col(CommentLike.comment_id).in_(
+                                [x.id for x in data["items"]]
+                            ),
+                            CommentLike.account_id == current_user.id,
+                        )
                     )
-                )
-            ).all()
-
-            like_map = {}
-            for comment_like, _ in likes:
-                like_map[comment_like.comment_id] = True
+                ).all()
+            )
 
             def _fill(x: Comment):
                 comment_read = CourseCommentRead.model_validate(x)
-                return comment_read.model_copy(
-                    update={"is_liked": like_map.get(x.id, False)}
-                )
+                comment_read.is_liked = x.id in liked
+                return comment_read
 
             data["items"] = list(map(_fill, data["items"]))
 
@@ -1354,32 +1284,30 @@ class CourseService:
                 selectinload(Comment.reply_to)
                 .selectinload(Comment.account)
                 .selectinload(Account.profile),
+                raiseload("*", sql_only=True),
             )
         )
 
         data = await paginate(session, query, page, per_page)
 
         if current_user:
-            likes = (
-                await session.exec(
-                    select(CommentLike, Comment)
-                    .join(CommentLike)
-                    .where(
-                        Comment.reply_to_id == comment_id,
-                        CommentLike.account_id == current_user.id,
+            liked = set(
+                (
+                    await session.exec(
+                        select(CommentLike.comment_id).where(
+                            col(CommentLike.comment_id).in_(
+                                [x.id for x in data["items"]]
+                            ),
+                            CommentLike.account_id == current_user.id,
+                        )
                     )
-                )
-            ).all()
-
-            like_map = {}
-            for comment_like, _ in likes:
-                like_map[comment_like.comment_id] = True
+                ).all()
+            )
 
             def _fill(x: Any):
                 comment_read = CourseCommentRead.model_validate(x)
-                return comment_read.model_copy(
-                    update={"is_liked": like_map.get(x.id, False)}
-                )
+                comment_read.is_liked = x.id in liked
+                return comment_read
 
             data["items"] = list(map(_fill, data["items"]))
 
@@ -1400,11 +1328,7 @@ class CourseService:
         """
         # Get the course
         course = (
-            await session.exec(
-                select(Course)
-                .where(Course.id == course_id)
-                .options(selectinload(Course.author).selectinload(Account.profile))
-            )
+            await session.exec(select(Course).where(Course.id == course_id))
         ).first()
 
         if not course:
@@ -1470,49 +1394,21 @@ class CourseService:
         comment_id: str, session: AsyncSession, current_user: Account
     ):
 
-        comment = (
-            await session.exec(
-                select(Comment)
-                .where(Comment.id == comment_id)
-                .options(
-                    selectinload(Comment.account).selectinload(Account.profile),
-                    selectinload(Comment.mention).selectinload(Account.profile),
-                )
-            )
-        ).first()
-
-        if not comment:
-            raise HTTPException(404, "comment not found!")
+        # comment.likes is kept in step by the comment_like trigger
+        delete_stmt = delete(CommentLike).where(
+            cast(BinaryExpression, CommentLike.account_id == current_user.id),
+            cast(BinaryExpression, CommentLike.comment_id == comment_id),
+        )
+        unliked = await session.exec(delete_stmt)  # type: ignore
 
-        like = (
-            await session.exec(
-                select(CommentLike).where(
-                    CommentLike.account_id == current_user.id,
-                    CommentLike.comment_id == comment_id,
-                )
-            )
-        ).first()
+        if not unliked.rowcount:
+            comment = (
+                await session.exec(select(Comment.id).where(Comment.id == comment_id))
+            ).first()
+            if not comment:
+                raise HTTPException(404, "comment not found!")
 
-        if like:
-            await session.delete(like)
-            update_stmt = (
-                update(Comment)
-                .where(cast(BinaryExpression, Comment.id == comment_id))
-                .values(
-                    likes=func.coalesce(Comment.likes, 1) - 1,
-                )
-            )
-            await session.exec(update_stmt)  # type:  ignore
-        else:
-            session.add(CommentLike(account_id=current_user.id, comment_id=comment.id))
-            update_stmt = (
-                update(Comment)
-                .where(cast(BinaryExpression, Comment.id == comment_id))
-                .values(
-                    likes=func.coalesce(Comment.likes, 0) + 1,
-                )
-            )
-            await session.exec(update_stmt)  # type:  ignore
+            session.add(CommentLike(account_id=current_user.id, comment_id=comment))
         await session.commit()
 
         return
@@ -1619,18 +1515,7 @@ class CourseService:
             )
 
             session.add(progress)
-            await session.flush()
-
-            update_stmt = (
-                update(Course)
-                .where(cast(BinaryExpression, Course.id == data.course_id))
-                .values(
-                    enrollment_count=func.coalesce(Course.enrollment_count, 0) + 1,
-                )
-            )
-
-            await session.exec(update_stmt)  # type: ignore
-
+            # course.enrollment_count is bumped by the enrollment trigger
             await session.commit()
             await session.refresh(enrollment)
             return enrollment
@@ -1728,4 +1613,14 @@ class CourseService:
 
         session.add(course)
         await session.commit()
-        await session.refresh(course)
+
+        # Reload author.profile and tags on the same instance the caller holds
+        await session.exec(
+            select(Course)
+            .where(Course.id == course.id)
+            .options(
+                selectinload(Course.author).selectinload(Account.profile),
+                selectinload(Course.tags),
+            )
+            .execution_options(populate_existing=True)
+        )
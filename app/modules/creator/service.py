@@ -1,6 +1,7 @@
 from typing import Optional
 
 from fastapi import HTTPException
+from sqlalchemy.orm import selectinload
 from sqlmodel import col, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -70,7 +71,14 @@ class CreatorService:
         page: int = 1,
         per_page: int = PER_PAGE,
     ):
-        query = select(Course).where(Course.account_id == current_user.id)
+        query = (
+            select(Course)
+            .where(Course.account_id == current_user.id)
+            .options(
+                selectinload(Course.author).selectinload(Account.profile),
+                selectinload(Course.tags),
+            )
+        )
         if title:
             query = query.where(col(Course.title).ilike(f"%{title}%"))
 
@@ -91,7 +99,14 @@ class CreatorService:
         if not user:
             raise HTTPException(404, "user not found")
 
-        query = select(Course).where(Course.account_id == user.id)
+        query = (
+            select(Course)
+            .where(Course.account_id == user.id)
+            .options(
+                selectinload(Course.author).selectinload(Account.profile),
+                selectinload(Course.tags),
+            )
+        )
         if title:
             query = query.where(col(Course.title).ilike(f"%{title}%"))
 
@@ -1,4 +1,8 @@
+import asyncio
 import io
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Annotated, Optional
 from urllib.parse import urlparse
@@ -14,7 +18,13 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import JSONResponse, RedirectResponse, Response
+from fastapi.responses import (
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
+from starlette.background import BackgroundTask
 
 from app.common.constants import (
     ALLOWED_EXTENSIONS,
@@ -70,8 +80,95 @@ async def get_storage_service(
         raise HTTPException(status_code=400, detail="Unsupported provider")
 
 
+PROXY_CHUNK_SIZE = 64 * 1024
+
+_proxy_client: Optional[httpx.AsyncClient] = None
+
+
+def get_proxy_client() -> httpx.AsyncClient:
+    """Shared pooled client for /media/proxy so upstream connections are reused."""
+    global _proxy_client
+    if _proxy_client is None:
+        _proxy_client = httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=50),
+        )
+    return _proxy_client
+
+
+async def close_proxy_client():
+    global _proxy_client
+    if _proxy_client is not None:
+        await _proxy_client.aclose()
+        _proxy_client = None
+
+
+PROXY_CACHE_TTL = 3600
+PROXY_CACHE_ITEM_MAX_BYTES = 1024 * 1024
+PROXY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ProxyCache:
+    """
+    In-process LRU of proxied bodies: url -> (content, content_type).
+
+    Entries expire after ``ttl`` seconds and the total size is capped at
+    ``max_bytes``; the least recently used entries are evicted first.
+    """
+
+    def __init__(self, ttl: float, max_bytes: int):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, bytes, str]] = OrderedDict()
+        self._size = 0
+        self._locks: dict[str, list] = {}
+
+    def get(self, url: str) -> Optional[tuple[bytes, str]]:
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._drop(url)
+            return None
+        self._entries.move_to_end(url)
+        return entry[1], entry[2]
+
+    def set(self, url: str, content: bytes, content_type: str):
+        if len(content) > self.max_bytes:
+            return
+        self._drop(url)
+        self._entries[url] = (time.monotonic() + self.ttl, content, content_type)
+        self._size += len(content)
+        while self._size > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, url: str):
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    @asynccontextmanager
+    async def lock(self, url: str):
+        # [lock, number of holders/waiters]; removed once nobody uses it
+        entry = self._locks.get(url)
+        if entry is None:
+            entry = self._locks[url] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                self._locks.pop(url, None)
+
+
+proxy_cache = ProxyCache(ttl=PROXY_CACHE_TTL, max_bytes=PROXY_CACHE_MAX_BYTES)
+
+
 # Whitelisted hostnames for external images
-ALLOWED_HOSTS = set(safe_json_loads(ALLOWED_IMAGE_ORIGIN, []))
+ALLOWED_HOSTS: frozenset[str] = frozenset(safe_json_loads(ALLOWED_IMAGE_ORIGIN, []))
 
 
 @media_routes.get("/media/proxy")
@@ -122,28 +219,66 @@ async def proxy_image(
                 # just bounce user to the provider's preview page
                 return RedirectResponse(url=urls["preview_url"])
 
-            # For direct, proxy the content
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(target_url)
+            headers = {
+                "Cache-Control": "public, max-age=3600",  # Cache for 1 hour
+                "X-Proxy-Source": provider.value,
+                "X-Media-Type": media_type.value,
+            }
 
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Failed to fetch document: {response.status_code}",
+            cached = proxy_cache.get(target_url)
+            if cached is not None:
+                return Response(
+                    content=cached[0], media_type=cached[1], headers=headers
                 )
 
-            content_type = response.headers.get(
-                "content-type", "application/octet-stream"
-            )
+            # One upstream fetch per URL at a time: concurrent misses wait here
+            # and are then served from the cache.
+            async with proxy_cache.lock(target_url):
+                cached = proxy_cache.get(target_url)
+                if cached is not None:
+                    return Response(
+                        content=cached[0], media_type=cached[1], headers=headers
+                    )
+
+                # For direct, stream the content through instead of buffering it
+                client = get_proxy_client()
+                response = await client.send(
+                    client.build_request("GET", target_url), stream=True
+                )
 
-            return Response(
-                content=response.content,
+                # Until the body is handed to StreamingResponse, any exit
+                # must release the pooled connection itself.
+                try:
+                    if response.status_code != 200:
+                        raise HTTPException(
+                            status_code=response.status_code,
+                            detail=f"Failed to fetch document: {response.status_code}",
+                        )
+
+                    content_type = response.headers.get(
+                        "content-type", "application/octet-stream"
+                    )
+
+                    # Small bodies are read whole and cached; anything else
+                    # streams.
+                    length = response.headers.get("content-length", "")
+                    if length.isdigit() and int(length) <= PROXY_CACHE_ITEM_MAX_BYTES:
+                        content = await response.aread()
+                        proxy_cache.set(target_url, content, content_type)
+                        return Response(
+                            content=content, media_type=content_type, headers=headers
+                        )
+                except BaseException:
+                    await response.aclose()
+                    raise
+
+            # The background task runs once the response is finished, even if
+            # the client disconnects before the body is fully sent.
+            return StreamingResponse(
+                response.aiter_bytes(PROXY_CHUNK_SIZE),
                 media_type=content_type,
-                headers={
-                    "Cache-Control": "public, max-age=3600",  # Cache for 1 hour
-                    "X-Proxy-Source": provider.value,
-                    "X-Media-Type": media_type.value,
-                },
+                headers=headers,
+                background=BackgroundTask(response.aclose),
             )
 
         except Exception as e:
@@ -193,7 +328,7 @@ async def upload_single_image(file: UploadFile = File(...)):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid image file. Allowed formats: "
-            + ", ".join(ALLOWED_EXTENSIONS),
+            + ", ".join(sorted(ALLOWED_EXTENSIONS)),
         )
 
     try:
@@ -14,10 +14,10 @@ from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.common.constants import (
-    ALLOWED_EXTENSIONS,
     DROPBOX_API,
     DROPBOX_SEARCH_URL,
     GOOGLE_FILES_URL,
+    is_allowed_upload,
 )
 from app.common.enum import DocumentPlatform, MediaType
 from app.core.dependencies import CurrentActiveUser
@@ -205,8 +205,7 @@ def validate_image(file: UploadFile) -> bool:
     """Validate if the uploaded file is a valid image"""
     try:
         # Check file extension
-        file_extension = Path(file.filename or "").suffix.lower()
-        if file_extension not in ALLOWED_EXTENSIONS:
+        if not is_allowed_upload(file.filename or ""):
             return False
 
         # Verify it's actually an image by trying to open it
@@ -369,7 +368,7 @@ class GoogleDriveStorageService(StorageService):
         if folder_id:
             query += f" and '{folder_id}' in parents"
         if mime_type:
-            if isinstance(mime_type, (list, tuple, set)):
+            if isinstance(mime_type, (list, tuple, set, frozenset)):
                 # multiple types -> build OR condition
                 mime_conditions = " or ".join([f"mimeType='{mt}'" for mt in mime_type])
                 query += f" and ({mime_conditions})"
@@ -538,7 +537,7 @@ class DropBoxStorageService(StorageService):
             data = self.normalize_response(res.json())
 
             if mime_type:
-                if isinstance(mime_type, (list, tuple)):
+                if isinstance(mime_type, (list, tuple, set, frozenset)):
 
                     return [
                         entry
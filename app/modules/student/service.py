@@ -66,6 +66,10 @@ class StudentService:
             .join(CourseEnrollment)
             .where(CourseEnrollment.account_id == current_user.id)
             .order_by(desc(CourseEnrollment.enrollment_date))
+            .options(
+                selectinload(Course.author).selectinload(Account.profile),
+                selectinload(Course.tags),
+            )
         )
 
         results = await paginate(session, enrolled, page, per_page)
@@ -165,6 +169,7 @@ class StudentService:
                 select(Section)
                 .where(Section.course_id == module.section.course_id)
                 .order_by(desc(Section.order_index))
+                .limit(1)
             )
         ).first()
         if not last_section:
@@ -175,6 +180,7 @@ class StudentService:
                 select(Module)
                 .where(Module.section_id == last_section.id)
                 .order_by(desc(Module.order_index))
+                .limit(1)
             )
         ).first()
         if not last_module:
@@ -194,6 +200,7 @@ class StudentService:
                         Module.order_index > module.order_index,
                     )
                     .order_by(asc(Module.order_index))
+                    .limit(1)
                 )
             ).first()
 
@@ -210,6 +217,7 @@ class StudentService:
                         )
                         .options(selectinload(Section.modules))
                         .order_by(asc(Section.order_index))
+                        .limit(1)
                     )
                 ).first()
 
@@ -236,23 +244,16 @@ class StudentService:
                 updates["current_streak"], progress.longest_streak
             )
 
-        _, progress = await StudentService._toggle_module_status(
-            current_user, session, module_id
+        # module, progress and enrollment are already loaded; mark the module
+        # finished on them instead of fetching all three again.
+        await StudentService._set_module_status(
+            session, module, progress, enrollment, module_id
         )
         progress.sqlmodel_update(updates)
 
         session.add(progress)
         await session.commit()
 
-        # Reload progress to ensure it's fresh from database
-        progress = (
-            await session.exec(
-                select(CourseProgress).where(CourseProgress.id == progress.id)
-            )
-        ).first()
-        if not progress:
-            raise HTTPException(404, "Progress not found after update")
-
         return progress
 
     @staticmethod
@@ -315,6 +316,19 @@ class StudentService:
         if not enrollment:
             raise HTTPException(404, "no enrollment found")
 
+        return await StudentService._set_module_status(
+            session, module, progress, enrollment, module_id, status
+        )
+
+    @staticmethod
+    async def _set_module_status(
+        session: AsyncSession,
+        module: Module,
+        progress: CourseProgress,
+        enrollment: CourseEnrollment,
+        module_id: str,
+        status: bool = True,
+    ):
         progress_data = progress.progress_data or {"finished_modules": []}
         finished = set(progress_data.get("finished_modules", []))
 
@@ -326,15 +340,13 @@ class StudentService:
         else:
             finished.discard(module_id)
 
-        all_modules = (
+        total_modules = (
             await session.exec(
-                select(Module)
+                select(func.count(col(Module.id)))
                 .join(Section)
                 .where(Section.course_id == module.section.course_id)
             )
-        ).all()
-
-        total_modules = len(all_modules)
+        ).one()
         completed_modules = len(finished)
 
         if completed_modules == total_modules and total_modules > 0:
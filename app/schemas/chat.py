@@ -1,8 +1,8 @@
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from app.models.chat_model import (
     ChatBase,
@@ -27,6 +27,8 @@ class ChatRead(ChatBase):
     id: uuid.UUID
     account_id: Optional[uuid.UUID] = None
     course_id: Optional[str] = None
+    member_count: int = 0
+    message_count: int = 0
 
     course: Optional[CourseRead] = None
     account: Optional[AccountRead] = None
@@ -101,6 +103,12 @@ class ChatMessageWrite(MessageBase):
     chat_id: uuid.UUID
     reply_to_id: Optional[uuid.UUID] = None
 
+    @field_validator("extra_data")
+    @classmethod
+    def empty_extra_data_as_null(cls, v: Optional[dict[str, Any]]):
+        """Store {} as NULL: no TOAST/JSONB parse on read, no GIN entry."""
+        return v or None
+
 
 class ChatMessageUpdate(BaseModel):
     content: str
@@ -0,0 +1,55 @@
+"""reaction per emoji
+
+Revision ID: 0b8e52f4a7c3
+Revises: a4c9d37e1f20
+Create Date: 2026-10-17 12:20:09.301845
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b8e52f4a7c3'
+down_revision: Union[str, Sequence[str], None] = 'a4c9d37e1f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        DELETE FROM message_reaction a
+        USING message_reaction b
+        WHERE a.account_id = b.account_id
+          AND a.message_id = b.message_id
+          AND a.emoji = b.emoji
+          AND a.id > b.id
+        """
+    )
+    op.drop_constraint('uix_account_message', 'message_reaction', type_='unique')
+    op.create_unique_constraint('uix_account_message_emoji', 'message_reaction', ['account_id', 'message_id', 'emoji'])
+    op.drop_index('ix_message_emoji', table_name='message_reaction')
+    op.create_index('ix_message_emoji', 'message_reaction', ['message_id', 'emoji'], unique=False, postgresql_include=['account_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Keep one reaction per (account, message) so the old key can be restored.
+    op.execute(
+        """
+        DELETE FROM message_reaction a
+        USING message_reaction b
+        WHERE a.account_id = b.account_id
+          AND a.message_id = b.message_id
+          AND a.id > b.id
+        """
+    )
+    op.drop_index('ix_message_emoji', table_name='message_reaction')
+    op.create_index('ix_message_emoji', 'message_reaction', ['message_id', 'emoji'], unique=False)
+    op.drop_constraint('uix_account_message_emoji', 'message_reaction', type_='unique')
+    op.create_unique_constraint('uix_account_message', 'message_reaction', ['account_id', 'message_id'])
@@ -0,0 +1,75 @@
+"""course foreign key indexes
+
+Revision ID: 1f5c8e3b9d27
+Revises: e9d15b7c3a40
+Create Date: 2026-10-17 18:21:09.385512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1f5c8e3b9d27'
+down_revision: Union[str, Sequence[str], None] = 'e9d15b7c3a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Progress rows already orphaned by SET NULL are unreachable.
+    op.execute('DELETE FROM course_progress WHERE course_id IS NULL')
+    op.drop_constraint('course_progress_course_id_fkey', 'course_progress', type_='foreignkey')
+    op.create_foreign_key(
+        'course_progress_course_id_fkey',
+        'course_progress',
+        'course',
+        ['course_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_course_account_id'),
+            'course',
+            ['account_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix_chat_course_id'),
+            'chat',
+            ['course_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_chat_course_id'),
+            table_name='chat',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_course_account_id'),
+            table_name='course',
+            postgresql_concurrently=True,
+        )
+
+    op.drop_constraint('course_progress_course_id_fkey', 'course_progress', type_='foreignkey')
+    op.create_foreign_key(
+        'course_progress_course_id_fkey',
+        'course_progress',
+        'course',
+        ['course_id'],
+        ['id'],
+        ondelete='SET NULL',
+    )
@@ -0,0 +1,37 @@
+"""commentlike bigint id
+
+Revision ID: 2c7f14b0e8a6
+Revises: b5e93a7d6c18
+Create Date: 2026-10-17 14:51:27.774530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c7f14b0e8a6'
+down_revision: Union[str, Sequence[str], None] = 'b5e93a7d6c18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nothing references commentlike.id, so the column is simply replaced;
+    # adding the identity column numbers the existing rows.
+    op.drop_constraint('commentlike_pkey', 'commentlike', type_='primary')
+    op.drop_column('commentlike', 'id')
+    op.add_column('commentlike', sa.Column('id', sa.BigInteger(), sa.Identity(always=False), nullable=False))
+    op.create_primary_key('commentlike_pkey', 'commentlike', ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('commentlike_pkey', 'commentlike', type_='primary')
+    op.drop_column('commentlike', 'id')
+    op.add_column('commentlike', sa.Column('id', sa.Uuid(), server_default=sa.text('gen_random_uuid()'), nullable=False))
+    op.create_primary_key('commentlike_pkey', 'commentlike', ['id'])
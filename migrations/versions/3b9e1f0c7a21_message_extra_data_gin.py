@@ -0,0 +1,45 @@
+"""message extra_data gin
+
+Revision ID: 3b9e1f0c7a21
+Revises: fac32e56d6bd
+Create Date: 2026-10-17 09:12:04.118532
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e1f0c7a21'
+down_revision: Union[str, Sequence[str], None] = 'fac32e56d6bd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_messages_extra_data_gin',
+            'message',
+            ['extra_data'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'extra_data': 'jsonb_path_ops'},
+            postgresql_where=sa.text('extra_data IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_messages_extra_data_gin',
+            table_name='message',
+            postgresql_concurrently=True,
+        )
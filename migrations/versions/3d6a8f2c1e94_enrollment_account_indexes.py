@@ -0,0 +1,73 @@
+"""enrollment account indexes
+
+Revision ID: 3d6a8f2c1e94
+Revises: 4e9a1c7b2d35
+Create Date: 2026-10-17 16:12:37.508214
+
+The single-column account_id indexes on course_enrollment and course_progress
+duplicate the leading column of the (account_id, course_id) unique
+constraints, which already serve every per-learner lookup and the
+ON DELETE CASCADE from account. They are replaced on course_enrollment by
+ix_enroll_account_date, which also serves the "my courses" page ordered by
+enrollment_date and the dashboard completion counts.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d6a8f2c1e94'
+down_revision: Union[str, Sequence[str], None] = '4e9a1c7b2d35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_enroll_account_date',
+            'course_enrollment',
+            ['account_id', sa.text('enrollment_date DESC')],
+            unique=False,
+            postgresql_include=['completion_date'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_course_enrollment_account_id'),
+            table_name='course_enrollment',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_course_progress_account_id'),
+            table_name='course_progress',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_course_progress_account_id'),
+            'course_progress',
+            ['account_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix_course_enrollment_account_id'),
+            'course_enrollment',
+            ['account_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_enroll_account_date',
+            table_name='course_enrollment',
+            postgresql_concurrently=True,
+        )
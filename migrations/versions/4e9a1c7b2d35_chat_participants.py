@@ -0,0 +1,66 @@
+"""chat participants
+
+Revision ID: 4e9a1c7b2d35
+Revises: f8b2d6a41e07
+Create Date: 2026-10-17 15:49:10.287416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e9a1c7b2d35'
+down_revision: Union[str, Sequence[str], None] = 'f8b2d6a41e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('chat', sa.Column('participant_ids', postgresql.ARRAY(sa.Uuid()), server_default='{}', nullable=False))
+    op.execute(
+        """
+        UPDATE chat SET participant_ids = COALESCE(
+            (SELECT array_agg(account_id) FROM chat_member WHERE chat_member.chat_id = chat.id),
+            '{}'
+        )
+        """
+    )
+    op.create_index('ix_chat_participants_gin', 'chat', ['participant_ids'], unique=False, postgresql_using='gin')
+
+    op.execute(
+        """
+        CREATE FUNCTION chat_participants_trg() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE chat SET participant_ids = array_append(participant_ids, NEW.account_id)
+                WHERE id = NEW.chat_id;
+            ELSE
+                UPDATE chat SET participant_ids = array_remove(participant_ids, OLD.account_id)
+                WHERE id = OLD.chat_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER chat_participants
+        AFTER INSERT OR DELETE ON chat_member
+        FOR EACH ROW EXECUTE FUNCTION chat_participants_trg()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER IF EXISTS chat_participants ON chat_member')
+    op.execute('DROP FUNCTION IF EXISTS chat_participants_trg()')
+    op.drop_index('ix_chat_participants_gin', table_name='chat', postgresql_using='gin')
+    op.drop_column('chat', 'participant_ids')
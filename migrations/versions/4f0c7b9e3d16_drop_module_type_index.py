@@ -0,0 +1,45 @@
+"""drop module type index
+
+Revision ID: 4f0c7b9e3d16
+Revises: d63a0f8e1b47
+Create Date: 2026-10-17 20:19:27.661358
+
+No query filters modules by module_type; modules are always reached
+through their section (uq_section_order) or by id. A handful of distinct
+values also makes the column a poor index key on its own.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f0c7b9e3d16'
+down_revision: Union[str, Sequence[str], None] = 'd63a0f8e1b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_module_module_type'),
+            table_name='module',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_module_module_type'),
+            'module',
+            ['module_type'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
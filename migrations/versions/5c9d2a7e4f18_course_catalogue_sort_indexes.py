@@ -0,0 +1,65 @@
+"""course catalogue sort indexes
+
+Revision ID: 5c9d2a7e4f18
+Revises: 7a3e5c1f9b62
+Create Date: 2026-10-17 19:05:14.627390
+
+ix_course_catalogue only serves the newest-first listing. These partial
+indexes over the same published/public slice let the top-rated, popular
+and most-enrolled listings read a page straight off an index as well,
+instead of sorting every public course per request.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c9d2a7e4f18'
+down_revision: Union[str, Sequence[str], None] = '7a3e5c1f9b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_course_catalogue_rating',
+            'course',
+            [
+                sa.text('average_rating DESC'),
+                sa.text('comment_count DESC'),
+                sa.text('enrollment_count DESC'),
+                sa.text('created_at DESC'),
+            ],
+            unique=False,
+            postgresql_where=sa.text("status = 'PUBLISHED' AND visibility = 'PUBLIC'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_course_catalogue_enrolled',
+            'course',
+            [sa.text('enrollment_count DESC')],
+            unique=False,
+            postgresql_where=sa.text("status = 'PUBLISHED' AND visibility = 'PUBLIC'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_course_catalogue_enrolled',
+            table_name='course',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_course_catalogue_rating',
+            table_name='course',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,95 @@
+"""chat counters
+
+Revision ID: 5f06b7d2c8e4
+Revises: e2f58b3c0d96
+Create Date: 2026-10-17 11:02:47.935160
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f06b7d2c8e4'
+down_revision: Union[str, Sequence[str], None] = 'e2f58b3c0d96'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('chat', sa.Column('member_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('chat', sa.Column('message_count', sa.Integer(), server_default='0', nullable=False))
+    op.create_index('ix_chat_last_message', 'chat', ['last_message_at'], unique=False)
+
+    op.execute(
+        """
+        UPDATE chat SET
+            member_count = (SELECT count(*) FROM chat_member WHERE chat_member.chat_id = chat.id),
+            message_count = (SELECT count(*) FROM message WHERE message.chat_id = chat.id),
+            last_message_at = GREATEST(
+                chat.last_message_at,
+                (SELECT max(created_at) FROM message WHERE message.chat_id = chat.id)
+            )
+        """
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION chat_member_count_trg() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE chat SET member_count = member_count + 1 WHERE id = NEW.chat_id;
+            ELSE
+                UPDATE chat SET member_count = member_count - 1 WHERE id = OLD.chat_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER chat_member_count
+        AFTER INSERT OR DELETE ON chat_member
+        FOR EACH ROW EXECUTE FUNCTION chat_member_count_trg()
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION chat_message_count_trg() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE chat SET
+                    message_count = message_count + 1,
+                    last_message_at = GREATEST(last_message_at, NEW.created_at)
+                WHERE id = NEW.chat_id;
+            ELSE
+                UPDATE chat SET message_count = message_count - 1 WHERE id = OLD.chat_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER chat_message_count
+        AFTER INSERT OR DELETE ON message
+        FOR EACH ROW EXECUTE FUNCTION chat_message_count_trg()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER IF EXISTS chat_message_count ON message')
+    op.execute('DROP FUNCTION IF EXISTS chat_message_count_trg()')
+    op.execute('DROP TRIGGER IF EXISTS chat_member_count ON chat_member')
+    op.execute('DROP FUNCTION IF EXISTS chat_member_count_trg()')
+    op.drop_index('ix_chat_last_message', table_name='chat')
+    op.drop_column('chat', 'message_count')
+    op.drop_column('chat', 'member_count')
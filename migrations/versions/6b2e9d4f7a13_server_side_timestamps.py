@@ -0,0 +1,75 @@
+"""server side timestamps
+
+Revision ID: 6b2e9d4f7a13
+Revises: a81f3c5d0e62
+Create Date: 2026-10-17 17:05:18.642730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b2e9d4f7a13'
+down_revision: Union[str, Sequence[str], None] = 'a81f3c5d0e62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'course_enrollment',
+        'enrollment_date',
+        existing_type=sa.DateTime(timezone=True),
+        server_default=sa.text('now()'),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'course_enrollment',
+        'last_accessed',
+        existing_type=sa.DateTime(timezone=True),
+        server_default=sa.text('now()'),
+        existing_nullable=False,
+    )
+    # quiz_attempt.start_time was missed by the UTC-aware migration.
+    op.alter_column(
+        'quiz_attempt',
+        'start_time',
+        existing_type=postgresql.TIMESTAMP(),
+        type_=sa.DateTime(timezone=True),
+        postgresql_using="start_time AT TIME ZONE 'UTC'",
+        server_default=sa.text('now()'),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'quiz_attempt',
+        'start_time',
+        existing_type=sa.DateTime(timezone=True),
+        type_=postgresql.TIMESTAMP(),
+        postgresql_using="start_time AT TIME ZONE 'UTC'",
+        server_default=None,
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'course_enrollment',
+        'last_accessed',
+        existing_type=sa.DateTime(timezone=True),
+        server_default=None,
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'course_enrollment',
+        'enrollment_date',
+        existing_type=sa.DateTime(timezone=True),
+        server_default=None,
+        existing_nullable=False,
+    )
@@ -0,0 +1,48 @@
+"""message autovacuum
+
+Revision ID: 6e1d0a9b3f57
+Revises: 0b8e52f4a7c3
+Create Date: 2026-10-17 12:48:36.774102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e1d0a9b3f57'
+down_revision: Union[str, Sequence[str], None] = '0b8e52f4a7c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # message is append-mostly: vacuum on inserts (not just dead tuples) so the
+    # visibility map stays current and ix_chat_created_at_desc scans stay
+    # index-only, and re-analyze before the newest created_at range goes stale.
+    op.execute(
+        """
+        ALTER TABLE message SET (
+            autovacuum_vacuum_insert_scale_factor = 0.02,
+            autovacuum_vacuum_scale_factor = 0.05,
+            autovacuum_analyze_scale_factor = 0.02
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        """
+        ALTER TABLE message RESET (
+            autovacuum_vacuum_insert_scale_factor,
+            autovacuum_vacuum_scale_factor,
+            autovacuum_analyze_scale_factor
+        )
+        """
+    )
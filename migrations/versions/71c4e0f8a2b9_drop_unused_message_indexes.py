@@ -0,0 +1,69 @@
+"""drop unused message indexes
+
+Revision ID: 71c4e0f8a2b9
+Revises: d38f6b1e9c42
+Create Date: 2026-10-17 13:58:41.092375
+
+Audit of the single-column indexes on the chat tables against the queries in
+app/modules/chat and the foreign-key actions that need them. Before running in
+production, confirm the dropped indexes show idx_scan = 0 in
+pg_stat_user_indexes:
+
+    SELECT indexrelname, idx_scan FROM pg_stat_user_indexes
+    WHERE indexrelname IN ('ix_message_message_type', 'ix_message_reaction_message_id');
+
+Dropped:
+- ix_message_message_type: no query filters or sorts on message_type.
+- ix_message_reaction_message_id: a prefix of ix_message_emoji (message_id, emoji).
+
+Kept:
+- ix_message_sender_id: serves ON DELETE SET NULL when a chat_member is removed.
+- ix_comment_mention_id: serves ON DELETE CASCADE when an account is deleted.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '71c4e0f8a2b9'
+down_revision: Union[str, Sequence[str], None] = 'd38f6b1e9c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_message_message_type'),
+            table_name='message',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_message_reaction_message_id'),
+            table_name='message_reaction',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_message_reaction_message_id'),
+            'message_reaction',
+            ['message_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix_message_message_type'),
+            'message',
+            ['message_type'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
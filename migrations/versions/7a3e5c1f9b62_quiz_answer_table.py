@@ -0,0 +1,77 @@
+"""quiz answer table
+
+Revision ID: 7a3e5c1f9b62
+Revises: 1f5c8e3b9d27
+Create Date: 2026-10-17 18:47:32.116204
+
+Moves quiz_attempt.answers (one JSONB object keyed by question id) into
+one quiz_answer row per question. Keys that are not ids of existing
+questions are dropped; is_correct and points are left for the grader.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3e5c1f9b62'
+down_revision: Union[str, Sequence[str], None] = '1f5c8e3b9d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'quiz_answer',
+        sa.Column('answer', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('is_correct', sa.Boolean(), nullable=True),
+        sa.Column('points', sa.Float(), nullable=True),
+        sa.Column('attempt_id', sa.Uuid(), nullable=False),
+        sa.Column('question_id', sa.Uuid(), nullable=False),
+        sa.ForeignKeyConstraint(['attempt_id'], ['quiz_attempt.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['question_id'], ['quiz_question.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('attempt_id', 'question_id'),
+    )
+    op.create_index(op.f('ix_quiz_answer_question_id'), 'quiz_answer', ['question_id'], unique=False)
+    # Non-object answers are wrapped so every row stays a JSON object.
+    op.execute(
+        """
+        INSERT INTO quiz_answer (attempt_id, question_id, answer)
+        SELECT a.id, q.id,
+               CASE WHEN jsonb_typeof(e.value) = 'object' THEN e.value
+                    ELSE jsonb_build_object('value', e.value) END
+        FROM quiz_attempt a
+        CROSS JOIN LATERAL jsonb_each(a.answers) AS e
+        JOIN quiz_question q ON q.id::text = e.key
+        WHERE jsonb_typeof(a.answers) = 'object'
+        """
+    )
+    op.drop_column('quiz_attempt', 'answers')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('quiz_attempt', sa.Column('answers', postgresql.JSONB(astext_type=sa.Text()), autoincrement=False, nullable=True))
+    op.execute(
+        """
+        UPDATE quiz_attempt a
+        SET answers = s.answers
+        FROM (
+            SELECT attempt_id,
+                   jsonb_object_agg(
+                       question_id::text,
+                       CASE WHEN answer ? 'value' AND (SELECT count(*) FROM jsonb_object_keys(answer)) = 1
+                            THEN answer -> 'value' ELSE answer END
+                   ) AS answers
+            FROM quiz_answer
+            GROUP BY attempt_id
+        ) s
+        WHERE a.id = s.attempt_id
+        """
+    )
+    op.drop_index(op.f('ix_quiz_answer_question_id'), table_name='quiz_answer')
+    op.drop_table('quiz_answer')
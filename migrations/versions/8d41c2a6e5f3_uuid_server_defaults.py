@@ -0,0 +1,44 @@
+"""uuid server defaults
+
+Revision ID: 8d41c2a6e5f3
+Revises: 3b9e1f0c7a21
+Create Date: 2026-10-17 09:40:51.602417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41c2a6e5f3'
+down_revision: Union[str, Sequence[str], None] = '3b9e1f0c7a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    'chat',
+    'chat_member',
+    'message',
+    'message_reaction',
+    'chat_invite',
+    'rating',
+    'comment',
+    'commentlike',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto covers older servers.
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,48 @@
+"""drop redundant order indexes
+
+Revision ID: 8e4b1d6c2a95
+Revises: 5c9d2a7e4f18
+Create Date: 2026-10-17 19:22:40.518337
+
+uq_course_order (course_id, order_index) and uq_section_order
+(section_id, order_index) already carry unique btree indexes that serve
+lookups by the parent id and ordered walks in either direction. The
+identical ix_course_order / ix_section_order, the single-column parent id
+indexes, and the bare order_index indexes (never filtered on alone) only
+added write cost.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b1d6c2a95'
+down_revision: Union[str, Sequence[str], None] = '5c9d2a7e4f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_course_order', table_name='section', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_section_course_id'), table_name='section', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_section_order_index'), table_name='section', postgresql_concurrently=True)
+        op.drop_index('ix_section_order', table_name='module', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_module_section_id'), table_name='module', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_module_order_index'), table_name='module', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_module_order_index'), 'module', ['order_index'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_module_section_id'), 'module', ['section_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_section_order', 'module', ['section_id', 'order_index'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_section_order_index'), 'section', ['order_index'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_section_course_id'), 'section', ['course_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_course_order', 'section', ['course_id', 'order_index'], unique=False, postgresql_concurrently=True)
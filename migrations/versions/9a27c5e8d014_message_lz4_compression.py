@@ -0,0 +1,33 @@
+"""message lz4 compression
+
+Revision ID: 9a27c5e8d014
+Revises: 6e1d0a9b3f57
+Create Date: 2026-10-17 13:10:52.208733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a27c5e8d014'
+down_revision: Union[str, Sequence[str], None] = '6e1d0a9b3f57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Applies to newly written values only; existing pglz values are still
+    # readable and get recompressed whenever a row is rewritten.
+    op.execute('ALTER TABLE message ALTER COLUMN content SET COMPRESSION lz4')
+    op.execute('ALTER TABLE message ALTER COLUMN extra_data SET COMPRESSION lz4')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('ALTER TABLE message ALTER COLUMN extra_data SET COMPRESSION default')
+    op.execute('ALTER TABLE message ALTER COLUMN content SET COMPRESSION default')
@@ -0,0 +1,70 @@
+"""unique live invite code
+
+Revision ID: a4c9d37e1f20
+Revises: 5f06b7d2c8e4
+Create Date: 2026-10-17 11:38:20.519664
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c9d37e1f20'
+down_revision: Union[str, Sequence[str], None] = '5f06b7d2c8e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        # Build the replacement first so lookups always have an index.
+        op.create_index(
+            'ix_chat_invite_live_code_uq',
+            'chat_invite',
+            ['invite_code'],
+            unique=True,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_chat_invite_live_code',
+            table_name='chat_invite',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_chat_invite_invite_code'),
+            table_name='chat_invite',
+            postgresql_concurrently=True,
+        )
+    op.execute('ALTER INDEX ix_chat_invite_live_code_uq RENAME TO ix_chat_invite_live_code')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_chat_invite_invite_code'),
+            'chat_invite',
+            ['invite_code'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_chat_invite_live_code_nu',
+            'chat_invite',
+            ['invite_code'],
+            unique=False,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_chat_invite_live_code',
+            table_name='chat_invite',
+            postgresql_concurrently=True,
+        )
+    op.execute('ALTER INDEX ix_chat_invite_live_code_nu RENAME TO ix_chat_invite_live_code')
@@ -0,0 +1,72 @@
+"""course catalogue index
+
+Revision ID: a81f3c5d0e62
+Revises: 3d6a8f2c1e94
+Create Date: 2026-10-17 16:40:52.173906
+
+The catalogue queries (explore, list, popular, by tag) all filter
+status = 'PUBLISHED' AND visibility = 'PUBLIC'. A partial index over that
+slice replaces the full index on course.status. course_enrollment.status is
+only ever filtered together with (account_id, course_id), which the unique
+constraint already serves, so its index is dropped.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a81f3c5d0e62'
+down_revision: Union[str, Sequence[str], None] = '3d6a8f2c1e94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_course_catalogue',
+            'course',
+            [sa.text('created_at DESC')],
+            unique=False,
+            postgresql_where=sa.text("status = 'PUBLISHED' AND visibility = 'PUBLIC'"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_course_status'),
+            table_name='course',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_course_enrollment_status'),
+            table_name='course_enrollment',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_course_enrollment_status'),
+            'course_enrollment',
+            ['status'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix_course_status'),
+            'course',
+            ['status'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_course_catalogue',
+            table_name='course',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,71 @@
+"""text array list columns
+
+Revision ID: b27f6e0c5d83
+Revises: 8e4b1d6c2a95
+Create Date: 2026-10-17 19:48:03.274819
+
+The list-of-strings columns (objectives, prerequisites, completion
+criteria) move from JSONB to native text[]. USING cannot contain a
+subquery, so a throwaway helper unpacks each JSON array; anything that
+is not an array becomes NULL.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b27f6e0c5d83'
+down_revision: Union[str, Sequence[str], None] = '8e4b1d6c2a95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = (
+    ('course', 'learning_objectives'),
+    ('course', 'prerequisites'),
+    ('section', 'learning_objectives'),
+    ('section', 'completion_criteria'),
+    ('module', 'prerequisites'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.jsonb_to_text_array(value jsonb) RETURNS text[]
+        LANGUAGE sql IMMUTABLE AS $$
+            SELECT CASE WHEN jsonb_typeof(value) = 'array' THEN
+                ARRAY(SELECT jsonb_array_elements_text(value))
+            END
+        $$
+        """
+    )
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.ARRAY(sa.Text()),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f'pg_temp.jsonb_to_text_array({column})',
+        )
+    op.execute('DROP FUNCTION pg_temp.jsonb_to_text_array(jsonb)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=postgresql.ARRAY(sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f'to_jsonb({column})',
+        )
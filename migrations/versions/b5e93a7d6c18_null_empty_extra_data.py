@@ -0,0 +1,32 @@
+"""null empty extra_data
+
+Revision ID: b5e93a7d6c18
+Revises: 71c4e0f8a2b9
+Create Date: 2026-10-17 14:25:03.418829
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e93a7d6c18'
+down_revision: Union[str, Sequence[str], None] = '71c4e0f8a2b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "UPDATE message SET extra_data = NULL "
+        "WHERE extra_data = '{}'::jsonb OR extra_data = 'null'::jsonb"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    pass
@@ -0,0 +1,31 @@
+"""quiz attempt number key
+
+Revision ID: c4f07a2e8b59
+Revises: 6b2e9d4f7a13
+Create Date: 2026-10-17 17:31:44.209581
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f07a2e8b59'
+down_revision: Union[str, Sequence[str], None] = '6b2e9d4f7a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_unique_constraint('uq_attempt', 'quiz_attempt', ['account_id', 'quiz_id', 'attempt_number'])
+    op.drop_index(op.f('ix_quiz_attempt_account_id'), table_name='quiz_attempt')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_quiz_attempt_account_id'), 'quiz_attempt', ['account_id'], unique=False)
+    op.drop_constraint('uq_attempt', 'quiz_attempt', type_='unique')
@@ -0,0 +1,63 @@
+"""message pagination index
+
+Revision ID: c7a0e4d91b58
+Revises: 8d41c2a6e5f3
+Create Date: 2026-10-17 10:05:33.870214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a0e4d91b58'
+down_revision: Union[str, Sequence[str], None] = '8d41c2a6e5f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_chat_created_at_desc',
+            'message',
+            ['chat_id', sa.text('created_at DESC'), 'id'],
+            unique=False,
+            postgresql_include=['sender_id', 'message_type', 'is_deleted'],
+            postgresql_concurrently=True,
+        )
+        # Both are prefixes of the new index.
+        op.drop_index(
+            'ix_chat_created_at', table_name='message', postgresql_concurrently=True
+        )
+        op.drop_index(
+            op.f('ix_message_chat_id'), table_name='message', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_message_chat_id'),
+            'message',
+            ['chat_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_chat_created_at',
+            'message',
+            ['chat_id', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_chat_created_at_desc',
+            table_name='message',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,41 @@
+"""comment thread index
+
+Revision ID: d38f6b1e9c42
+Revises: 9a27c5e8d014
+Create Date: 2026-10-17 13:34:15.660127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd38f6b1e9c42'
+down_revision: Union[str, Sequence[str], None] = '9a27c5e8d014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_comment_thread_created',
+            'comment',
+            ['reply_to_id', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_comment_thread_created',
+            table_name='comment',
+            postgresql_concurrently=True,
+        )
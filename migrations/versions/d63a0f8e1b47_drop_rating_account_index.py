@@ -0,0 +1,44 @@
+"""drop rating account index
+
+Revision ID: d63a0f8e1b47
+Revises: b27f6e0c5d83
+Create Date: 2026-10-17 20:06:51.904126
+
+uix_account_course (account_id, course_id) already serves lookups by
+account_id alone, and the "has X rated Y" probe as a single index hit.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd63a0f8e1b47'
+down_revision: Union[str, Sequence[str], None] = 'b27f6e0c5d83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_rating_account_id'),
+            table_name='rating',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_rating_account_id'),
+            'rating',
+            ['account_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,60 @@
+"""chat invite live indexes
+
+Revision ID: e2f58b3c0d96
+Revises: c7a0e4d91b58
+Create Date: 2026-10-17 10:31:12.447905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2f58b3c0d96'
+down_revision: Union[str, Sequence[str], None] = 'c7a0e4d91b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Retire invites that are already used up so they leave the partial indexes.
+    op.execute(
+        "UPDATE chat_invite SET is_active = false "
+        "WHERE is_active AND max_uses IS NOT NULL AND current_uses >= max_uses"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_chat_invite_live_code',
+            'chat_invite',
+            ['invite_code'],
+            unique=False,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_chat_invite_chat_live',
+            'chat_invite',
+            ['chat_id'],
+            unique=False,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_chat_invite_chat_live',
+            table_name='chat_invite',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_chat_invite_live_code',
+            table_name='chat_invite',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,132 @@
+"""course counter triggers
+
+Revision ID: e9d15b7c3a40
+Revises: c4f07a2e8b59
+Create Date: 2026-10-17 17:58:26.731045
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9d15b7c3a40'
+down_revision: Union[str, Sequence[str], None] = 'c4f07a2e8b59'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A rating's own comment is not counted; replies to it are.
+    op.execute(
+        """
+        UPDATE course SET
+            enrollment_count = (
+                SELECT count(*) FROM course_enrollment e WHERE e.course_id = course.id
+            ),
+            comment_count = (
+                SELECT count(*) FROM comment c
+                WHERE c.course_id = course.id
+                  AND (NOT c.is_rating OR c.reply_to_id IS NOT NULL)
+            ),
+            total_rating = r.total,
+            stars = r.stars,
+            average_rating = COALESCE(r.stars::float / NULLIF(r.total, 0), 0)
+        FROM (
+            SELECT course.id, count(rating.id) AS total, COALESCE(sum(rating.star), 0) AS stars
+            FROM course LEFT JOIN rating ON rating.course_id = course.id
+            GROUP BY course.id
+        ) r
+        WHERE r.id = course.id
+        """
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION bump_course_enrollments() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE course SET enrollment_count = enrollment_count + 1 WHERE id = NEW.course_id;
+            ELSE
+                UPDATE course SET enrollment_count = enrollment_count - 1 WHERE id = OLD.course_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER course_enrollment_count
+        AFTER INSERT OR DELETE ON course_enrollment
+        FOR EACH ROW EXECUTE FUNCTION bump_course_enrollments()
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION bump_course_comments() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                IF NOT NEW.is_rating OR NEW.reply_to_id IS NOT NULL THEN
+                    UPDATE course SET comment_count = comment_count + 1 WHERE id = NEW.course_id;
+                END IF;
+            ELSIF NOT OLD.is_rating OR OLD.reply_to_id IS NOT NULL THEN
+                UPDATE course SET comment_count = comment_count - 1 WHERE id = OLD.course_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER course_comments_count
+        AFTER INSERT OR DELETE ON comment
+        FOR EACH ROW EXECUTE FUNCTION bump_course_comments()
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION bump_course_ratings() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE course SET
+                    total_rating = total_rating + 1,
+                    stars = stars + NEW.star,
+                    average_rating = (stars + NEW.star)::float / (total_rating + 1)
+                WHERE id = NEW.course_id;
+            ELSE
+                UPDATE course SET
+                    total_rating = total_rating - 1,
+                    stars = stars - OLD.star,
+                    average_rating = COALESCE(
+                        (stars - OLD.star)::float / NULLIF(total_rating - 1, 0), 0
+                    )
+                WHERE id = OLD.course_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER course_ratings_stats
+        AFTER INSERT OR DELETE ON rating
+        FOR EACH ROW EXECUTE FUNCTION bump_course_ratings()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER IF EXISTS course_ratings_stats ON rating')
+    op.execute('DROP FUNCTION IF EXISTS bump_course_ratings()')
+    op.execute('DROP TRIGGER IF EXISTS course_comments_count ON comment')
+    op.execute('DROP FUNCTION IF EXISTS bump_course_comments()')
+    op.execute('DROP TRIGGER IF EXISTS course_enrollment_count ON course_enrollment')
+    op.execute('DROP FUNCTION IF EXISTS bump_course_enrollments()')
@@ -0,0 +1,85 @@
+"""comment counter triggers
+
+Revision ID: f8b2d6a41e07
+Revises: 2c7f14b0e8a6
+Create Date: 2026-10-17 15:22:48.506193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8b2d6a41e07'
+down_revision: Union[str, Sequence[str], None] = '2c7f14b0e8a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        UPDATE comment SET
+            likes = (SELECT count(*) FROM commentlike WHERE commentlike.comment_id = comment.id),
+            comment_count = (SELECT count(*) FROM comment r WHERE r.reply_to_id = comment.id)
+        """
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION bump_comment_likes() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE comment SET likes = likes + 1 WHERE id = NEW.comment_id;
+            ELSE
+                UPDATE comment SET likes = likes - 1 WHERE id = OLD.comment_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER comment_likes_count
+        AFTER INSERT OR DELETE ON commentlike
+        FOR EACH ROW EXECUTE FUNCTION bump_comment_likes()
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION bump_comment_replies() RETURNS trigger AS $$
+        BEGIN
+            -- A trigger on both INSERT and DELETE cannot filter on NEW/OLD in
+            -- its WHEN clause, so top-level comments are skipped here.
+            IF TG_OP = 'INSERT' THEN
+                IF NEW.reply_to_id IS NOT NULL THEN
+                    UPDATE comment SET comment_count = comment_count + 1 WHERE id = NEW.reply_to_id;
+                END IF;
+            ELSIF OLD.reply_to_id IS NOT NULL THEN
+                UPDATE comment SET comment_count = comment_count - 1 WHERE id = OLD.reply_to_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER comment_replies_count
+        AFTER INSERT OR DELETE ON comment
+        FOR EACH ROW EXECUTE FUNCTION bump_comment_replies()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER IF EXISTS comment_replies_count ON comment')
+    op.execute('DROP FUNCTION IF EXISTS bump_comment_replies()')
+    op.execute('DROP TRIGGER IF EXISTS comment_likes_count ON commentlike')
+    op.execute('DROP FUNCTION IF EXISTS bump_comment_likes()')